@@ -0,0 +1,50 @@
+"""add_audit_logs_keyset_index
+
+Revision ID: a41c7e2d9b53
+Revises: 38137451d0df, 9f8d3f4b2a10
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = "a41c7e2d9b53"
+down_revision = ("38137451d0df", "9f8d3f4b2a10")
+branch_labels = None
+depends_on = None
+
+
+def _index_names(inspector) -> set:
+    return {index["name"] for index in inspector.get_indexes("audit_logs")}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if "audit_logs" not in inspector.get_table_names():
+        return
+    if "audit_logs_ws_time_action_idx" in _index_names(inspector):
+        return
+
+    # Serves workspace-scoped audit log pages ordered by logged_at DESC
+    op.create_index(
+        "audit_logs_ws_time_action_idx",
+        "audit_logs",
+        ["workspace_id", sa.text("logged_at DESC"), "action"],
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if "audit_logs" not in inspector.get_table_names():
+        return
+    if "audit_logs_ws_time_action_idx" not in _index_names(inspector):
+        return
+
+    op.drop_index("audit_logs_ws_time_action_idx", table_name="audit_logs")
@@ -0,0 +1,50 @@
+"""add_deleted_items_keyset_index
+
+Revision ID: c7e19b4f2d86
+Revises: a41c7e2d9b53
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = "c7e19b4f2d86"
+down_revision = "a41c7e2d9b53"
+branch_labels = None
+depends_on = None
+
+
+def _index_names(inspector) -> set:
+    return {index["name"] for index in inspector.get_indexes("deleted_items")}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if "deleted_items" not in inspector.get_table_names():
+        return
+    if "deleted_items_ws_deleted_id_idx" in _index_names(inspector):
+        return
+
+    # Serves trash bin keyset pages ordered by (deleted_at, id) DESC
+    op.create_index(
+        "deleted_items_ws_deleted_id_idx",
+        "deleted_items",
+        ["workspace_id", sa.text("deleted_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if "deleted_items" not in inspector.get_table_names():
+        return
+    if "deleted_items_ws_deleted_id_idx" not in _index_names(inspector):
+        return
+
+    op.drop_index("deleted_items_ws_deleted_id_idx", table_name="deleted_items")
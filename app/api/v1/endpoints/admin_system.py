@@ -4,7 +4,7 @@ API endpoints for System Administration (Module 14)
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
@@ -25,6 +25,7 @@ from app.services.admin import (
     SecurityIncidentService,
     ChangeRequestService,
     AccessReviewService,
+    AdminStatsService,
 )
 from app.schemas.admin import (
     AdminUserResponse, AdminUserCreate, AdminUserUpdate,
@@ -33,7 +34,8 @@ from app.schemas.admin import (
     AdminUserRoleResponse, RoleAssignmentRequest, RoleApprovalRequest,
     SystemConfigResponse, SystemConfigCreate, SystemConfigUpdate,
     FeatureFlagResponse, FeatureFlagCreate, FeatureFlagUpdate,
-    AdminAuditLogResponse, AdminAuditLogCreate, AuditLogQuery,
+    AdminAuditLogResponse, AdminAuditLogCreate, AuditLogQuery, AdminAuditLogListAdapter,
+    audit_log_response_from_orm,
     SecurityIncidentResponse, SecurityIncidentCreate, SecurityIncidentUpdate,
     ChangeRequestResponse, ChangeRequestCreate, ChangeRequestUpdate, ChangeRequestApproval,
     AccessReviewResponse, AccessReviewCreate, AccessReviewDecision,
@@ -491,7 +493,7 @@ def create_audit_log(
     Module 14 - Audit-first / Write-protected Logs
     """
     service = AuditLogService(db)
-    return service.create_log(log_data)
+    return audit_log_response_from_orm(service.create_log(log_data))
 
 
 @router.get("/audit-logs", response_model=List[AdminAuditLogResponse])
@@ -519,7 +521,11 @@ def query_audit_logs(
     )
     
     service = AuditLogService(db)
-    return service.query_logs(query_params)
+    logs = [audit_log_response_from_orm(log) for log in service.query_logs(query_params)]
+    return Response(
+        content=AdminAuditLogListAdapter.dump_json(logs),
+        media_type="application/json",
+    )
 
 
 # ======= Security Incident Endpoints =======
@@ -724,22 +730,5 @@ def get_admin_stats(
     current_admin: AdminUser = Depends(require_admin_roles("super_admin", "system_admin")),
 ):
     """Get admin system statistics"""
-    from app.models.admin import AdminUser, AdminRole, AdminPermission, ChangeRequest, SecurityIncident, AccessReview
-    
-    total_admin_users = db.query(AdminUser).count()
-    active_admin_users = db.query(AdminUser).filter(AdminUser.is_active == True).count()
-    total_roles = db.query(AdminRole).count()
-    total_permissions = db.query(AdminPermission).count()
-    pending_change_requests = db.query(ChangeRequest).filter(ChangeRequest.status == "pending").count()
-    open_security_incidents = db.query(SecurityIncident).filter(SecurityIncident.status == "open").count()
-    pending_access_reviews = db.query(AccessReview).filter(AccessReview.status == "pending").count()
-    
-    return AdminStats(
-        total_admin_users=total_admin_users,
-        active_admin_users=active_admin_users,
-        total_roles=total_roles,
-        total_permissions=total_permissions,
-        pending_change_requests=pending_change_requests,
-        open_security_incidents=open_security_incidents,
-        pending_access_reviews=pending_access_reviews
-    )
+    service = AdminStatsService(db)
+    return service.get_stats()
@@ -6,18 +6,19 @@ retention policies, and audit logging.
 
 Ref: Module 8 - Data Archiving and Compliance
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.core.security import get_current_user
-from app.db.session import get_db
+from app.db.session import SessionLocal, get_db
 from app.models.users import User
 from app.schemas.archive import (
     ArchivePolicyCreate, ArchivePolicyUpdate, ArchivePolicyRead,
-    DeletedItemListResponse, RestoreDeletedItemRequest,
+    DeletedItemListResponse, DeletedItemListAdapter, RestoreDeletedItemRequest,
     DataExportRequestCreate, DataExportListResponse, DataExportResponse,
-    AuditLogListResponse, AuditLogQueryFilter,
+    AuditLogListResponse, AuditLogListAdapter, AuditLogQueryFilter,
     ArchiveActionResponse, BulkArchiveResponse, Statistics
 )
 from app.services.archive import (
@@ -96,29 +97,39 @@ def get_trash_bin(
     entity_type: Optional[str] = Query(None, description="Filter by entity type"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; skips the total count"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Get deleted items in trash bin for a workspace.
     
+    Pass the returned next_cursor back as `cursor` for keyset pagination;
+    `total` is omitted on cursor pages.
+    
     Ref: Module 8 - Feature 2.2 - AC 3 - Restore Capability
     """
     trash_service = TrashBinService(db)
-    items, total = trash_service.get_trash_bin(
-        workspace_id=workspace_id,
-        entity_type=entity_type,
-        page=page,
-        page_size=page_size
-    )
+    try:
+        items, total, next_cursor = trash_service.get_trash_bin(
+            workspace_id=workspace_id,
+            entity_type=entity_type,
+            page=page,
+            page_size=page_size,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return DeletedItemListResponse(
-        items=items,
+    page_data = DeletedItemListResponse.model_construct(
+        items=DeletedItemListAdapter.validate_python(items, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
-        has_more=(page * page_size) < total
+        has_more=next_cursor is not None,
+        next_cursor=next_cursor
     )
+    return Response(content=page_data.model_dump_json(), media_type="application/json")
 
 
 @router.post("/trash-bin/{item_id}/restore", response_model=ArchiveActionResponse)
@@ -200,6 +211,7 @@ def create_data_export(
     return DataExportResponse(
         export_id=request.id,
         download_url=f"/api/v1/archive/exports/{request.id}/download?token={request.download_token}",
+        stream_url=f"/api/v1/archive/exports/{request.id}/stream?token={request.download_token}",
         expires_at=request.expires_at,
         file_size_bytes=request.file_size_bytes,
         format=request.export_format
@@ -264,6 +276,48 @@ def download_export(
     return {"message": "Download implementation pending"}
 
 
+@router.get("/exports/{export_id}/stream")
+def stream_export(
+    export_id: str,
+    token: str = Query(..., description="Download token"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Stream exported records as NDJSON (one JSON object per line).
+    Rows are read in batches from a server-side cursor, so large exports
+    are never held in memory.
+    
+    Ref: Module 8 - Feature 2.3 - Data Export & Portability
+    """
+    export_service = DataExportService(db)
+    
+    try:
+        export_request = export_service.get_downloadable_export(export_id, token)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    export_service.increment_download_count(export_id)
+    workspace_id = export_request.workspace_id
+    scope = export_request.scope
+    scope_id = export_request.scope_id
+    
+    def _ndjson_chunks():
+        # The request-scoped session is closed once the handler returns,
+        # so the stream owns its own session for the cursor's lifetime.
+        stream_db = SessionLocal()
+        try:
+            yield from DataExportService(stream_db).iter_ndjson_export(workspace_id, scope, scope_id)
+        finally:
+            stream_db.close()
+    
+    return StreamingResponse(
+        _ndjson_chunks(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="export-{export_id}.ndjson"'}
+    )
+
+
 # ============ Audit Log Endpoints ============
 
 @router.get("/audit-logs", response_model=AuditLogListResponse)
@@ -274,6 +328,7 @@ def get_audit_logs(
     user_id: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; skips the total count"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -281,6 +336,9 @@ def get_audit_logs(
     Get audit logs with filtering.
     Requires ADMIN role for accessing audit logs.
     
+    Pass the returned next_cursor back as `cursor` for keyset pagination;
+    `total` is omitted on cursor pages.
+    
     Ref: Module 8 - Section 3.2 - Data Retention Policy
     """
     audit_service = AuditService(db)
@@ -290,18 +348,24 @@ def get_audit_logs(
         resource_type=resource_type,
         user_id=user_id,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        cursor=cursor
     )
     
-    logs, total = audit_service.get_audit_logs(workspace_id, filters)
+    try:
+        logs, total, next_cursor = audit_service.get_audit_logs(workspace_id, filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return AuditLogListResponse(
-        items=logs,
+    page_data = AuditLogListResponse.model_construct(
+        items=AuditLogListAdapter.validate_python(logs, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
-        has_more=(page * page_size) < total
+        has_more=next_cursor is not None,
+        next_cursor=next_cursor
     )
+    return Response(content=page_data.model_dump_json(), media_type="application/json")
 
 
 # ============ Statistics & Dashboard Endpoints ============
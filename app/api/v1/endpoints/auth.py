@@ -111,7 +111,7 @@ async def verify_email(
     auth_service = AuthService(db, EmailService())
     
     try:
-        auth_service.verify_email(request.user_id, request.token)
+        auth_service.verify_email(UUID(request.user_id), request.token)
         return {"message": "Email verified successfully"}
     except HTTPException as e:
         raise e
@@ -136,7 +136,7 @@ async def resend_verification(
     
     try:
         if request.user_id:
-            auth_service.resend_verification_email(request.user_id)
+            auth_service.resend_verification_email(UUID(request.user_id))
             return {"message": "Verification email sent"}
 
         user = db.query(User).filter(User.email == request.email).first()
@@ -508,7 +508,7 @@ async def revoke_session(
     session_service = SessionService(db)
     
     try:
-        session_service.revoke_session(current_user.id, request.session_id)
+        session_service.revoke_session(current_user.id, UUID(request.session_id))
         return {"message": "Session revoked successfully"}
     except HTTPException as e:
         raise e
@@ -613,7 +613,7 @@ async def reset_password(
     auth_service = AuthService(db, EmailService())
     
     try:
-        auth_service.reset_password(request.user_id, request.token, request.new_password)
+        auth_service.reset_password(UUID(request.user_id), request.token, request.new_password)
         return {"message": "Password reset successfully"}
     except HTTPException as e:
         raise e
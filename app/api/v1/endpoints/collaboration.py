@@ -12,7 +12,7 @@ REST endpoints for all collaboration features:
 
 from typing import Optional, List
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status, Query, File, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query, File, UploadFile
 from sqlalchemy.orm import Session
 
 from app.core.security import get_current_user
@@ -23,6 +23,7 @@ from app.schemas.collaboration import (
     AttachmentCreate, AttachmentResponse, AttachmentVersionResponse,
     NoteCreate, NoteUpdate, NoteResponse, NoteTreeResponse, NoteConvertToTaskRequest,
     NoteVersionResponse, NoteVersionDiffRequest, NoteVersionRestoreRequest,
+    NoteListAdapter, NoteTreeListAdapter, NoteVersionListAdapter, CommentThreadListAdapter,
     ApprovalCreate, ApprovalApprove, ApprovalRequestChanges, ApprovalReject, ApprovalRecordResponse,
     PublicLinkCreate, PublicLinkResponse, PublicLinkAccessRequest,
     SmartBacklinkResponse, BacklinkSuggestionResponse,
@@ -117,10 +118,12 @@ def get_task_comments(
     current_user: User = Depends(get_current_user),
 ):
     """Get all comments for a task"""
-    from app.db.models import Comment
     comments = CommentService.get_comments_for_task(db=db, task_id=task_id)
     
-    return comments
+    return Response(
+        content=CommentThreadListAdapter.dump_json(CommentThreadResponse.build_threads(comments)),
+        media_type="application/json",
+    )
 
 
 @router.post("/comments/{comment_id}/reactions/{emoji}", status_code=200)
@@ -269,12 +272,13 @@ def get_note(
     current_user: User = Depends(get_current_user),
 ):
     """Get note with nested children and comments"""
-    from app.db.models import Note
-    note = db.query(Note).filter(Note.id == note_id).first()
-    if not note:
+    notes = NoteService.get_note_subtree(db=db, note_id=note_id)
+    if not notes:
         raise HTTPException(status_code=404, detail="Note not found")
     
-    return note
+    # The requested note is the only root: every other row's parent is in the subtree
+    tree = NoteTreeResponse.build_forest(notes)[0]
+    return Response(content=tree.model_dump_json(), media_type="application/json")
 
 
 @router.patch("/notes/{note_id}", response_model=NoteResponse)
@@ -303,13 +307,12 @@ def get_project_notes(
     current_user: User = Depends(get_current_user),
 ):
     """Get all notes in a project"""
-    from app.db.models import Note
-    notes = db.query(Note).filter(
-        Note.project_id == project_id,
-        Note.parent_note_id.is_(None),  # Only top-level
-    ).all()
+    notes = NoteService.get_project_notes(db=db, project_id=project_id)
     
-    return notes
+    return Response(
+        content=NoteTreeListAdapter.dump_json(NoteTreeResponse.build_forest(notes)),
+        media_type="application/json",
+    )
 
 
 @router.get("/notes/user/personal", response_model=List[NoteResponse])
@@ -327,7 +330,10 @@ def get_personal_notes(
         Note.access_level == NoteAccessEnum.PRIVATE,
     ).all()
     
-    return notes
+    return Response(
+        content=NoteListAdapter.dump_json([NoteResponse.from_orm_fast(note) for note in notes]),
+        media_type="application/json",
+    )
 
 
 @router.post("/notes/{note_id}/convert-to-task", status_code=201)
@@ -362,7 +368,12 @@ def get_note_versions(
     """Get all versions of a note"""
     versions = NoteVersionService.get_versions(db=db, note_id=note_id)
     
-    return versions
+    return Response(
+        content=NoteVersionListAdapter.dump_json(
+            [NoteVersionResponse.from_orm_fast(version) for version in versions]
+        ),
+        media_type="application/json",
+    )
 
 
 @router.post("/notes/{note_id}/restore", response_model=NoteResponse)
@@ -569,14 +580,15 @@ def search_collaboration(
             "relevance_score": 0.0,
         })
     
-    return {
-        "total_count": total_count,
-        "limit": request.limit,
-        "offset": request.offset,
-        "results": mapped_results,
-        "query": request.query,
-        "search_time_ms": 0,  # Would measure actual search time
-    }
+    search_response = CollaborationSearchResponse(
+        total_count=total_count,
+        limit=request.limit,
+        offset=request.offset,
+        results=mapped_results,
+        query=request.query,
+        search_time_ms=0,  # Would measure actual search time
+    )
+    return Response(content=search_response.model_dump_json(), media_type="application/json")
 
 
 # ============ Presence Endpoints ============
@@ -5,11 +5,13 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.core.security import get_current_user
 from app.models.users import User
+from app.utils.responses import PydanticResponse
 from app.models.workspaces import WorkspaceMember
 from app.db.enums import WorkspaceRole
 from app.services.help_center import (
@@ -22,7 +24,9 @@ from app.services.help_center import (
     SearchService,
 )
 # Create additional router with /help prefix as alias/shortcut
-help_router = APIRouter(prefix="/help", tags=["Help Center & Knowledge Base"])
+help_router = APIRouter(
+    prefix="/help", tags=["Help Center & Knowledge Base"], default_response_class=ORJSONResponse
+)
 from app.core.background_tasks import IndexingTask, NotificationTask
 from app.schemas.help_center import (
     CategoryResponse, CategoryCreate, CategoryUpdate,
@@ -35,9 +39,12 @@ from app.schemas.help_center import (
     FailedSearchResponse, FailedSearchCreate,
     SearchResponse, SearchResult, SearchQuery,
     ContextualHelpResponse, ContextualSuggestion,
+    CategoryListAdapter, ArticleListAdapter, RouteMappingListAdapter,
 )
 
-router = APIRouter(prefix="/help-center", tags=["Help Center & Knowledge Base"])
+router = APIRouter(
+    prefix="/help-center", tags=["Help Center & Knowledge Base"], default_response_class=ORJSONResponse
+)
 
 
 # ======= Category Endpoints =======
@@ -59,7 +66,10 @@ def list_categories(
     current_user: User = Depends(get_current_user),
 ):
     service = CategoryService(db)
-    return service.list_categories(is_active)
+    categories = CategoryListAdapter.validate_python(
+        service.list_categories(is_active), from_attributes=True
+    )
+    return PydanticResponse(categories, adapter=CategoryListAdapter)
 
 
 @router.patch("/categories/{category_id}", response_model=CategoryResponse)
@@ -107,12 +117,16 @@ def list_articles(
     )
     role_names = [role[0].value if isinstance(role[0], WorkspaceRole) else role[0] for role in user_roles]
     
-    return service.list_articles(
+    articles = service.list_articles(
         status=status,
         category_id=category_id,
         user_id=current_user.id,
         user_roles=role_names
     )
+    return PydanticResponse(
+        ArticleListAdapter.validate_python(articles, from_attributes=True),
+        adapter=ArticleListAdapter,
+    )
 
 
 @router.get("/articles/{article_id}", response_model=ArticleResponse)
@@ -144,7 +158,7 @@ def get_article(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Article not found or access denied"
         )
-    return article
+    return PydanticResponse(ArticleResponse.model_validate(article))
 
 
 @router.patch("/articles/{article_id}", response_model=ArticleResponse)
@@ -220,7 +234,7 @@ def get_reader_content(
     translation = service.get_reader_content(article_id, locale)
     if not translation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Content not found")
-    return translation
+    return PydanticResponse(ArticleTranslationResponse.model_validate(translation))
 
 
 # ======= Route Mapping Endpoints =======
@@ -242,7 +256,10 @@ def list_route_mappings(
     current_user: User = Depends(get_current_user),
 ):
     service = RouteMappingService(db)
-    return service.list_mappings(is_active)
+    mappings = RouteMappingListAdapter.validate_python(
+        service.list_mappings(is_active), from_attributes=True
+    )
+    return PydanticResponse(mappings, adapter=RouteMappingListAdapter)
 
 
 @router.get("/contextual", response_model=ContextualHelpResponse)
@@ -263,7 +280,7 @@ def get_contextual_help(
         )
         for mapping in mappings
     ]
-    return ContextualHelpResponse(route=route, suggestions=suggestions)
+    return PydanticResponse(ContextualHelpResponse(route=route, suggestions=suggestions))
 
 
 # ======= Visibility Endpoints =======
@@ -334,7 +351,7 @@ def search_articles(
         for item in results
     ]
 
-    return SearchResponse(query=query, results=formatted)
+    return PydanticResponse(SearchResponse(query=query, results=formatted))
 
 
 @router.post("/search/failed", response_model=FailedSearchResponse, status_code=status.HTTP_201_CREATED)
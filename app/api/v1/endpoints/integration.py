@@ -6,13 +6,15 @@ RESTful endpoints for API tokens, webhooks, OAuth, plugins, and governance.
 Ref: Module 12 - Integration Ecosystem
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy import and_, or_, desc, func
 from datetime import datetime
 from typing import Optional
 
 from app.core.security import get_current_user
 from app.db.session import get_db
+from app.utils.responses import PydanticResponse
 from app.models.users import User
 from app.models.integration import ApiToken, WebhookEndpoint, OAuthConnection, IntegrationBinding, Plugin, PluginInstallation, ConsentGrant
 from app.models.integrations import ApiUsageLog
@@ -27,14 +29,17 @@ from app.schemas.integration import (
     PluginCreate, PluginUpdate, PluginRead, PluginListResponse,
     PluginInstallationCreate, PluginInstallationUpdate, PluginInstallationRead, PluginInstallationListResponse,
     ConsentGrantCreate, ConsentGrantRead, ConsentGrantListResponse,
-    IntegrationStatusResponse, HealthCheckResponse
+    IntegrationStatusResponse, HealthCheckResponse,
+    ApiTokenListAdapter, ApiScopeListAdapter, WebhookEndpointListAdapter, OAuthAppListAdapter,
+    OAuthConnectionListAdapter, IntegrationBindingListAdapter, PluginListAdapter,
+    PluginInstallationListAdapter, ConsentGrantListAdapter
 )
 from app.services.integration import (
     ApiTokenService, WebhookService, OAuthService, PluginService, ConsentService
 )
 
 
-router = APIRouter(prefix="/api/v1/integration", tags=["integration"])
+router = APIRouter(prefix="/api/v1/integration", tags=["integration"], default_response_class=ORJSONResponse)
 
 
 # ============ API Token Endpoints ============
@@ -79,12 +84,13 @@ def list_api_tokens(
     total = query.count()
     items = query.offset((page - 1) * page_size).limit(page_size).all()
     
-    return ApiTokenListResponse(
-        items=items,
+    page_data = ApiTokenListResponse.model_construct(
+        items=ApiTokenListAdapter.validate_python(items, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size
     )
+    return PydanticResponse(page_data)
 
 
 @router.patch("/tokens/{token_id}")
@@ -146,10 +152,11 @@ def list_api_scopes(
     """
     scopes = db.query(ApiScope).filter(ApiScope.is_deprecated == False).all()
     
-    return ApiScopeListResponse(
-        items=scopes,
+    page_data = ApiScopeListResponse.model_construct(
+        items=ApiScopeListAdapter.validate_python(scopes, from_attributes=True),
         total=len(scopes)
     )
+    return PydanticResponse(page_data)
 
 
 # ============ API Usage Log Endpoints ============
@@ -174,12 +181,13 @@ def get_api_usage_logs(
     total = query.count()
     items = query.offset((page - 1) * page_size).limit(page_size).all()
     
-    return ApiUsageLogListResponse(
+    page_data = ApiUsageLogListResponse(
         items=items,
         total=total,
         page=page,
         page_size=page_size
     )
+    return PydanticResponse(page_data)
 
 
 # ============ Webhook Endpoint Endpoints ============
@@ -224,12 +232,13 @@ def list_webhook_endpoints(
     total = query.count()
     items = query.offset((page - 1) * page_size).limit(page_size).all()
     
-    return WebhookEndpointListResponse(
-        items=items,
+    page_data = WebhookEndpointListResponse.model_construct(
+        items=WebhookEndpointListAdapter.validate_python(items, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size
     )
+    return PydanticResponse(page_data)
 
 
 @router.patch("/webhooks/{endpoint_id}", response_model=WebhookEndpointRead)
@@ -284,12 +293,13 @@ def list_oauth_apps(
     total = query.count()
     items = query.offset((page - 1) * page_size).limit(page_size).all()
     
-    return OAuthAppListResponse(
-        items=items,
+    page_data = OAuthAppListResponse.model_construct(
+        items=OAuthAppListAdapter.validate_python(items, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size
     )
+    return PydanticResponse(page_data)
 
 
 # ============ OAuth Connection Endpoints ============
@@ -334,12 +344,13 @@ def list_oauth_connections(
     total = query.count()
     items = query.offset((page - 1) * page_size).limit(page_size).all()
     
-    return OAuthConnectionListResponse(
-        items=items,
+    page_data = OAuthConnectionListResponse.model_construct(
+        items=OAuthConnectionListAdapter.validate_python(items, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size
     )
+    return PydanticResponse(page_data)
 
 
 @router.delete("/oauth/connections/{connection_id}")
@@ -407,12 +418,13 @@ def list_integration_bindings(
     total = query.count()
     items = query.offset((page - 1) * page_size).limit(page_size).all()
     
-    return IntegrationBindingListResponse(
-        items=items,
+    page_data = IntegrationBindingListResponse.model_construct(
+        items=IntegrationBindingListAdapter.validate_python(items, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size
     )
+    return PydanticResponse(page_data)
 
 
 # ============ Plugin Endpoints ============
@@ -435,12 +447,13 @@ def list_plugins(
     total = query.count()
     items = query.offset((page - 1) * page_size).limit(page_size).all()
     
-    return PluginListResponse(
-        items=items,
+    page_data = PluginListResponse.model_construct(
+        items=PluginListAdapter.validate_python(items, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size
     )
+    return PydanticResponse(page_data)
 
 
 @router.get("/plugins/{plugin_id}", response_model=PluginRead)
@@ -456,7 +469,7 @@ def get_plugin_detail(
     if not plugin:
         raise HTTPException(status_code=404, detail="Plugin not found")
     
-    return plugin
+    return PydanticResponse(PluginRead.model_validate(plugin))
 
 
 # ============ Plugin Installation Endpoints ============
@@ -500,12 +513,13 @@ def list_installed_plugins(
     total = query.count()
     items = query.offset((page - 1) * page_size).limit(page_size).all()
     
-    return PluginInstallationListResponse(
-        items=items,
+    page_data = PluginInstallationListResponse.model_construct(
+        items=PluginInstallationListAdapter.validate_python(items, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size
     )
+    return PydanticResponse(page_data)
 
 
 @router.patch("/plugins/install/{installation_id}", response_model=PluginInstallationRead)
@@ -575,12 +589,13 @@ def list_consents(
     total = query.count()
     items = query.offset((page - 1) * page_size).limit(page_size).all()
     
-    return ConsentGrantListResponse(
-        items=items,
+    page_data = ConsentGrantListResponse.model_construct(
+        items=ConsentGrantListAdapter.validate_python(items, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size
     )
+    return PydanticResponse(page_data)
 
 
 @router.delete("/consents/{consent_id}")
@@ -618,23 +633,23 @@ def get_integration_status(
     """
     Get integration ecosystem status.
     """
-    api_tokens_count = db.query(ApiToken).filter(
-        and_(ApiToken.workspace_id == workspace_id, ApiToken.is_active == True)
-    ).count()
-    
-    active_webhooks = db.query(WebhookEndpoint).filter(
-        and_(WebhookEndpoint.workspace_id == workspace_id, WebhookEndpoint.is_active == True)
-    ).count()
-    
-    oauth_connections = db.query(OAuthConnection).filter(
-        and_(OAuthConnection.workspace_id == workspace_id, OAuthConnection.is_active == True)
-    ).count()
-    
-    plugins_installed = db.query(PluginInstallation).filter(
-        and_(PluginInstallation.workspace_id == workspace_id, PluginInstallation.is_enabled == True)
-    ).count()
-    
-    return IntegrationStatusResponse(
+    # One round trip: each counter is a scalar subquery in a single SELECT
+    api_tokens_count, active_webhooks, oauth_connections, plugins_installed = db.query(
+        db.query(func.count(ApiToken.id)).filter(
+            and_(ApiToken.workspace_id == workspace_id, ApiToken.is_active == True)
+        ).scalar_subquery(),
+        db.query(func.count(WebhookEndpoint.id)).filter(
+            and_(WebhookEndpoint.workspace_id == workspace_id, WebhookEndpoint.is_active == True)
+        ).scalar_subquery(),
+        db.query(func.count(OAuthConnection.id)).filter(
+            and_(OAuthConnection.workspace_id == workspace_id, OAuthConnection.is_active == True)
+        ).scalar_subquery(),
+        db.query(func.count(PluginInstallation.id)).filter(
+            and_(PluginInstallation.workspace_id == workspace_id, PluginInstallation.is_enabled == True)
+        ).scalar_subquery(),
+    ).one()
+    
+    status_data = IntegrationStatusResponse(
         api_tokens_count=api_tokens_count,
         active_webhooks_count=active_webhooks,
         oauth_connections_count=oauth_connections,
@@ -643,6 +658,7 @@ def get_integration_status(
         rate_limit_remaining=0,
         rate_limit_reset_at=datetime.utcnow()
     )
+    return PydanticResponse(status_data)
 
 
 @router.get("/health", response_model=HealthCheckResponse)
@@ -34,7 +34,8 @@ from app.schemas.notification import (
     NotificationPreferenceRead, NotificationPreferenceUpdate,
     WatcherCreate, WatcherRead, InteractionTrackingRequest,
     NotificationTemplateListResponse, WatcherListResponse,
-    NotificationStatistics, InteractionLogListResponse
+    NotificationStatistics, InteractionLogListResponse,
+    NotificationTemplateListAdapter, InteractionLogListAdapter, WatcherListAdapter
 )
 from app.db.enums import NotificationPriorityEnum
 from sqlalchemy import select, and_
@@ -221,7 +222,7 @@ async def list_interactions(
     ).scalars().all()
     
     return InteractionLogListResponse(
-        items=[InteractionLogRead.from_orm(log) for log in logs],
+        items=InteractionLogListAdapter.validate_python(logs, from_attributes=True),
         total=total,
         page=page,
         page_size=limit
@@ -311,7 +312,7 @@ async def list_templates(
     ).scalars().all()
     
     return NotificationTemplateListResponse(
-        items=[NotificationTemplateRead.from_orm(t) for t in templates],
+        items=NotificationTemplateListAdapter.validate_python(templates, from_attributes=True),
         total=total,
         page=page,
         page_size=limit
@@ -426,7 +427,7 @@ async def list_watchers(
     )
     
     return WatcherListResponse(
-        items=[WatcherRead.from_orm(w) for w in watchers],
+        items=WatcherListAdapter.validate_python(watchers, from_attributes=True),
         total=len(watchers)
     )
 
@@ -468,18 +469,10 @@ async def get_statistics(
         Notification.workspace_id == workspace_id
     ])
     
-    # Total sent
-    total_sent = db.execute(
-        select(func.count(Notification.id)).where(*query_filter)
-    ).scalar()
-    
-    # Total read
-    total_read = db.execute(
-        select(func.count(Notification.id)).where(
-            *query_filter,
-            Notification.read_at.isnot(None)
-        )
-    ).scalar() or 0
+    # Total sent and total read in one pass (COUNT(col) skips NULL read_at)
+    total_sent, total_read = db.execute(
+        select(func.count(Notification.id), func.count(Notification.read_at)).where(*query_filter)
+    ).one()
     
     # Calculate rates
     open_rate = (total_read / total_sent * 100) if total_sent > 0 else 0
@@ -493,14 +486,14 @@ async def get_statistics(
     
     top_event_types = {str(t[0]): t[1] for t in top_types}
     
-    # Channel distribution
+    # Channel distribution: fetch only the channel column, not full rows
     top_channels = {}
-    notifications = db.execute(
-        select(Notification).where(*query_filter)
-    ).scalars().all()
+    channel_lists = db.execute(
+        select(Notification.channels_used).where(*query_filter)
+    ).scalars()
     
-    for notif in notifications:
-        for channel in notif.channels_used:
+    for channels_used in channel_lists:
+        for channel in channels_used or ():
             channel_str = str(channel)
             top_channels[channel_str] = top_channels.get(channel_str, 0) + 1
     
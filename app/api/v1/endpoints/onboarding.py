@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.core.security import get_current_user, get_current_user_with_session
 from app.models.users import User
+from app.utils.responses import PydanticResponse
 from app.services.onboarding import (
     SurveyService,
     PersonaService,
@@ -35,6 +36,7 @@ from app.schemas.onboarding import (
     OnboardingRewardResponse, OnboardingRewardCreate,
     FeatureBeaconResponse, FeatureBeaconCreate,
     UserBeaconStateResponse,
+    OnboardingSurveyListAdapter, FeatureBeaconListAdapter,
 )
 
 router = APIRouter(prefix="/onboarding", tags=["User Onboarding & Adoption"])
@@ -59,7 +61,8 @@ def list_surveys(
     current_user: User = Depends(get_current_user),
 ):
     service = SurveyService(db)
-    return service.list_surveys(is_active)
+    surveys = [OnboardingSurveyResponse.from_orm_fast(s) for s in service.list_surveys(is_active)]
+    return PydanticResponse(surveys, adapter=OnboardingSurveyListAdapter)
 
 
 @router.post("/surveys/{survey_id}/questions", response_model=SurveyQuestionResponse, status_code=status.HTTP_201_CREATED)
@@ -129,7 +132,7 @@ def get_status(
     status_obj = service.get_user_status(current_user.id)
     if not status_obj:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Status not found")
-    return status_obj
+    return PydanticResponse(UserOnboardingStatusResponse.from_orm_fast(status_obj))
 
 
 @router.patch("/status", response_model=UserOnboardingStatusResponse)
@@ -259,7 +262,8 @@ def list_beacons(
     current_user: User = Depends(get_current_user),
 ):
     service = FeatureBeaconService(db)
-    return service.list_beacons(is_active)
+    beacons = [FeatureBeaconResponse.from_orm_fast(b) for b in service.list_beacons(is_active)]
+    return PydanticResponse(beacons, adapter=FeatureBeaconListAdapter)
 
 
 @router.post("/beacons/{beacon_id}/dismiss", response_model=UserBeaconStateResponse)
@@ -13,6 +13,7 @@ Ref: Module 9 - User Experience Personalization
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import List
@@ -20,6 +21,7 @@ from typing import List
 from app.core.security import get_current_user
 from app.db.session import get_db
 from app.models.users import User
+from app.utils.responses import PydanticResponse
 from app.schemas.personalization import (
     UserSettingsRead,
     UserSettingsUpdate,
@@ -48,6 +50,7 @@ from app.schemas.personalization import (
     PersonalizationPreferencesResponse,
     LocalizationStringRead,
     TranslationDictionary,
+    NotificationPreferenceListAdapter,
 )
 from app.services.personalization import (
     PersonalizationService,
@@ -59,7 +62,9 @@ from app.services.personalization import (
     LocalizationService,
 )
 
-router = APIRouter(prefix="/personalization", tags=["Personalization"])
+router = APIRouter(
+    prefix="/personalization", tags=["Personalization"], default_response_class=ORJSONResponse
+)
 
 
 # ============ User Settings Endpoints ============
@@ -146,13 +151,14 @@ async def list_dashboard_layouts(
         skip=(page - 1) * page_size,
         limit=page_size
     )
-    return DashboardLayoutListResponse(
+    page_data = DashboardLayoutListResponse.model_construct(
         total=total,
         page=page,
         page_size=page_size,
         has_more=(page * page_size) < total,
-        items=items
+        items=[DashboardLayoutRead.from_orm_fast(layout) for layout in items],
     )
+    return PydanticResponse(page_data)
 
 
 @router.put("/dashboard/layouts/{layout_id}", response_model=DashboardLayoutRead, summary="Update dashboard layout")
@@ -194,10 +200,11 @@ async def list_widget_configs(
 ):
     """List all widget configurations for user."""
     configs = WidgetConfigService.list_widget_configs(db, current_user.id)
-    return WidgetConfigListResponse(
+    page_data = WidgetConfigListResponse.model_construct(
         total=len(configs),
-        items=configs
+        items=[WidgetConfigRead.from_orm_fast(config) for config in configs],
     )
+    return PydanticResponse(page_data)
 
 
 @router.put("/widgets/{widget_id}", response_model=WidgetConfigRead, summary="Update widget configuration")
@@ -246,10 +253,11 @@ async def list_notification_preferences(
         skip=(page - 1) * page_size,
         limit=page_size
     )
-    return NotificationPreferenceListResponse(
+    page_data = NotificationPreferenceListResponse.model_construct(
         total=total,
-        items=items
+        items=NotificationPreferenceListAdapter.validate_python(items, from_attributes=True),
     )
+    return PydanticResponse(page_data)
 
 
 @router.get("/notifications/preferences/{event_type}", response_model=NotificationPreferenceRead, summary="Get notification preference")
@@ -316,10 +324,11 @@ async def list_keyboard_shortcuts(
         skip=(page - 1) * page_size,
         limit=page_size
     )
-    return KeyboardShortcutListResponse(
+    page_data = KeyboardShortcutListResponse.model_construct(
         total=total,
-        items=items
+        items=[KeyboardShortcutRead.from_orm_fast(shortcut) for shortcut in items],
     )
+    return PydanticResponse(page_data)
 
 
 @router.post("/shortcuts", response_model=KeyboardShortcutRead, summary="Create keyboard shortcut", status_code=status.HTTP_201_CREATED)
@@ -454,14 +463,20 @@ async def sync_personalization(
     # Get notification preferences
     prefs, _ = NotificationPreferenceService.list_preferences(db, current_user.id, limit=50)
     
-    return PersonalizationSyncResponse(
-        user_settings=user_settings,
-        dashboard_layouts=layouts,
-        accessibility_profile=accessibility,
-        keyboard_shortcuts=shortcuts,
-        notification_preferences=prefs,
+    # Rows come straight from the DB; only JSON-backed nested settings need validation
+    sync_data = PersonalizationSyncResponse.model_construct(
+        user_settings=UserSettingsRead.from_orm_fast(user_settings),
+        dashboard_layouts=[DashboardLayoutRead.from_orm_fast(layout) for layout in layouts],
+        accessibility_profile=(
+            AccessibilityProfileRead.model_validate(accessibility) if accessibility else None
+        ),
+        keyboard_shortcuts=[KeyboardShortcutRead.from_orm_fast(shortcut) for shortcut in shortcuts],
+        notification_preferences=NotificationPreferenceListAdapter.validate_python(
+            prefs, from_attributes=True
+        ),
         last_synced_at=dt.utcnow()
     )
+    return PydanticResponse(sync_data)
 
 
 @router.post("/reset", response_model=PersonalizationActionResponse, summary="Reset all personalization to defaults")
@@ -7,12 +7,14 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.core.security import get_current_user
 from app.models.users import User
 from app.db.enums import ProjectStatus
+from app.utils.responses import PydanticResponse
 from app.schemas.project import (
     ProjectCreate,
     ProjectUpdate,
@@ -44,7 +46,7 @@ from app.services.project import (
     ProjectChangeRequestService,
 )
 
-router = APIRouter(prefix="/v1/projects", tags=["projects"])
+router = APIRouter(prefix="/v1/projects", tags=["projects"], default_response_class=ORJSONResponse)
 
 
 # ===== Project CRUD Operations =====
@@ -108,7 +110,11 @@ def list_projects(
         archived,
     )
     
-    return ProjectListResponse(total=total, items=projects)
+    page_data = ProjectListResponse.model_construct(
+        total=total,
+        items=[ProjectResponse.from_orm_fast(project) for project in projects],
+    )
+    return PydanticResponse(page_data)
 
 
 @router.get(
@@ -14,8 +14,10 @@ engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,  # Log SQL queries in debug mode
     pool_pre_ping=True,   # Test connection before using from pool
-    pool_size=10,         # Number of connections to keep in the pool
-    max_overflow=20,      # Maximum overflow connections
+    pool_size=settings.DATABASE_POOL_SIZE,        # Connections kept in the pool
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,  # Burst connections above pool_size
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,  # Wait for a free connection
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,  # Drop stale server-side connections
 )
 
 # Create session factory
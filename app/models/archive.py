@@ -91,6 +91,7 @@ class DeletedItem(Base, TimestampMixin):
         Index("ix_deleted_items_entity_type", "entity_type"),
         Index("ix_deleted_items_deleted_at", "deleted_at"),
         Index("ix_deleted_items_is_restored", "is_restored"),
+        Index("deleted_items_ws_deleted_id_idx", "workspace_id", deleted_at.desc(), id.desc()),
     )
 
 
@@ -260,4 +261,5 @@ class AuditLog(Base, TimestampMixin):
         Index("ix_audit_logs_action", "action"),
         Index("ix_audit_logs_resource_type", "resource_type"),
         Index("ix_audit_logs_logged_at", "logged_at"),
+        Index("audit_logs_ws_time_action_idx", "workspace_id", logged_at.desc(), "action"),
     )
@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 import uuid
 
 from app.repositories.base import BaseRepository
-from app.models.users import User, Role, Permission
+from app.models.users import User, Role, Permission, user_roles, role_permissions
 from app.db.enums import UserStatus
 
 
@@ -317,16 +317,14 @@ class UserRepository(BaseRepository[User]):
         Returns:
             List of permission instances
         """
-        user = self.get_by_id(user_id)
-        if not user:
-            return []
-        
-        permissions = []
-        for role in user.roles:
-            permissions.extend(role.permissions)
-        
-        # Remove duplicates
-        return list({perm.id: perm for perm in permissions}.values())
+        return (
+            self.db.query(Permission)
+            .join(role_permissions, role_permissions.c.permission_id == Permission.id)
+            .join(user_roles, user_roles.c.role_id == role_permissions.c.role_id)
+            .filter(user_roles.c.user_id == user_id)
+            .distinct()
+            .all()
+        )
     
     def has_permission(self, user_id: uuid.UUID, permission_name: str) -> bool:
         """
@@ -339,8 +337,14 @@ class UserRepository(BaseRepository[User]):
         Returns:
             True if user has permission, False otherwise
         """
-        permissions = self.get_user_permissions(user_id)
-        return any(perm.permission_name == permission_name for perm in permissions)
+        query = (
+            self.db.query(Permission.id)
+            .join(role_permissions, role_permissions.c.permission_id == Permission.id)
+            .join(user_roles, user_roles.c.role_id == role_permissions.c.role_id)
+            .filter(user_roles.c.user_id == user_id)
+            .filter(Permission.code == permission_name)
+        )
+        return self.db.query(query.exists()).scalar()
     
     # ==================== STATISTICS ====================
     
@@ -0,0 +1,91 @@
+"""
+OpenAPI examples for request/response schemas, keyed by schema class name.
+
+Kept out of the schema modules and attached only when
+settings.SCHEMA_EXAMPLES_ENABLED is set, so production processes do not
+carry them on every model or emit them in /openapi.json.
+"""
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+
+EXAMPLES: Dict[str, Dict[str, Any]] = {
+    "UserRegisterRequest": {
+        "email": "user@example.com",
+        "username": "johndoe",
+        "password": "SecurePass123!",
+        "full_name": "John Doe"
+    },
+    "EmailVerifyRequest": {
+        "user_id": "123e4567-e89b-12d3-a456-426614174000",
+        "token": "verification_token_from_email"
+    },
+    "LoginRequest": {
+        "email": "user@example.com",
+        "password": "SecurePass123!"
+    },
+    "SessionResponse": {
+        "user_id": "123e4567-e89b-12d3-a456-426614174000",
+        "session_id": "session_id_uuid",
+        "token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+        "expires_in": 1800,
+        "user": {
+            "id": "123e4567-e89b-12d3-a456-426614174000",
+            "email": "user@example.com",
+            "username": "johndoe",
+            "full_name": "John Doe",
+            "status": "active",
+            "email_verified_at": "2024-01-30T10:00:00Z",
+            "created_at": "2024-01-29T10:00:00Z"
+        }
+    },
+    "MFAEnableResponse": {
+        "secret_key": "JBSWY3DPEBLW64TMMQ======",
+        "qr_code": "data:image/png;base64,iVBORw0KGgo...",
+        "backup_codes": [
+            "12345678",
+            "87654321",
+            "11223344"
+        ]
+    },
+    "ErrorResponse": {
+        "detail": "Email already registered",
+        "error_code": "EMAIL_ALREADY_EXISTS"
+    },
+    "OAuthLoginRequest": {
+        "provider": "google",
+        "code": "4/0AX4XfWh...",
+        "redirect_uri": "http://localhost:3000/auth/callback"
+    },
+    "OAuthUrlResponse": {
+        "auth_url": "https://accounts.google.com/o/oauth2/v2/auth?...",
+        "state": "random_state_string"
+    },
+    "KeyboardShortcutCheatsheet": {
+        "shortcuts": [
+            {
+                "key": "Ctrl+K",
+                "action": "Open Command Palette",
+                "context": "Global"
+            },
+            {
+                "key": "C",
+                "action": "Create Task",
+                "context": "Dashboard"
+            },
+            {
+                "key": "?",
+                "action": "Show Shortcuts",
+                "context": "Global"
+            }
+        ]
+    }
+}
+
+
+def example_for(schema_name: str) -> Optional[Dict[str, Any]]:
+    """json_schema_extra for a schema, or None when examples are disabled."""
+    if not settings.SCHEMA_EXAMPLES_ENABLED or schema_name not in EXAMPLES:
+        return None
+    return {"example": EXAMPLES[schema_name]}
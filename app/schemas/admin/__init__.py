@@ -0,0 +1,97 @@
+"""
+Pydantic schemas for System Administration (Module 14)
+
+Schemas are split into submodules by area. Names are resolved lazily
+(PEP 562) so ``from app.schemas.admin import X`` only builds the schemas
+of the submodule that defines ``X``.
+"""
+from importlib import import_module
+
+
+_EXPORTS = {
+    # users
+    "AdminUserBase": "users",
+    "AdminUserCreate": "users",
+    "AdminUserUpdate": "users",
+    "AdminUserResponse": "users",
+    "AdminLoginRequest": "users",
+    "AdminLoginResponse": "users",
+    # roles
+    "AdminRoleCategory": "roles",
+    "AdminRoleBase": "roles",
+    "AdminRoleCreate": "roles",
+    "AdminRoleUpdate": "roles",
+    "AdminRoleResponse": "roles",
+    "AdminPermissionBase": "roles",
+    "AdminPermissionCreate": "roles",
+    "AdminPermissionUpdate": "roles",
+    "AdminPermissionResponse": "roles",
+    "AdminUserRoleCreate": "roles",
+    "AdminUserRoleResponse": "roles",
+    "RoleAssignmentRequest": "roles",
+    "RoleApprovalRequest": "roles",
+    "RolePermissionAssignment": "roles",
+    "BulkRoleAssignment": "roles",
+    # system
+    "ConfigDataType": "system",
+    "SystemConfigBase": "system",
+    "SystemConfigCreate": "system",
+    "SystemConfigUpdate": "system",
+    "SystemConfigResponse": "system",
+    "FeatureFlagBase": "system",
+    "FeatureFlagCreate": "system",
+    "TargetingRules": "system",
+    "FeatureFlagUpdate": "system",
+    "FeatureFlagResponse": "system",
+    "AdminStats": "system",
+    # audit
+    "AuditChanges": "audit",
+    "AdminAuditLogCreate": "audit",
+    "AuditLogStatus": "audit",
+    "AdminAuditLogResponseBase": "audit",
+    "AdminAuditLogSuccessResponse": "audit",
+    "AdminAuditLogFailureResponse": "audit",
+    "AdminAuditLogResponse": "audit",
+    "audit_log_response_from_orm": "audit",
+    "AuditLogQuery": "audit",
+    "AdminAuditLogListAdapter": "audit",
+    # security
+    "SeverityLevel": "security",
+    "IncidentStatus": "security",
+    "AccessReviewType": "security",
+    "AccessReviewDecisionType": "security",
+    "SecurityIncidentBase": "security",
+    "SecurityIncidentCreate": "security",
+    "SecurityIncidentUpdate": "security",
+    "SecurityIncidentResponse": "security",
+    "AccessReviewBase": "security",
+    "AccessReviewCreate": "security",
+    "AccessReviewDecision": "security",
+    "AccessReviewResponse": "security",
+    # change_mgmt
+    "ChangeType": "change_mgmt",
+    "ChangeRequestStatus": "change_mgmt",
+    "ChangeRequestBase": "change_mgmt",
+    "ChangeRequestCreate": "change_mgmt",
+    "ChangeRequestUpdate": "change_mgmt",
+    "ChangeRequestApproval": "change_mgmt",
+    "ChangeRequestResponseBase": "change_mgmt",
+    "ChangeRequestPlannedResponse": "change_mgmt",
+    "ChangeRequestDeployedResponse": "change_mgmt",
+    "ChangeRequestResponse": "change_mgmt",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,97 @@
+"""
+Admin audit log schemas (Module 14)
+"""
+from datetime import datetime
+from typing import Optional, List, Dict, Any, ClassVar, Literal, Union, Annotated
+from uuid import UUID
+
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+
+from app.schemas.base import EpochDatetime, ORMReadMixin
+
+
+# ======= Shared Types =======
+
+AuditLogStatus = Literal["success", "failed", "denied"]
+
+
+# ======= AdminAuditLog Schemas =======
+
+class AuditChanges(BaseModel):
+    """Before/after state of the audited resource; other keys are kept as-is"""
+    before: Optional[Dict[str, Any]] = None
+    after: Optional[Dict[str, Any]] = None
+
+    model_config = ConfigDict(extra="allow")
+
+
+class AdminAuditLogCreate(BaseModel):
+    admin_user_id: UUID
+    action: str
+    resource_type: str
+    resource_id: Optional[UUID] = None
+    ip_address: Optional[str] = None
+    user_agent: Optional[str] = None
+    session_id: Optional[str] = None
+    changes: Optional[AuditChanges] = None
+    metadata: Optional[Dict[str, Any]] = None
+    status: AuditLogStatus = "success"
+    error_message: Optional[str] = None
+
+
+class AdminAuditLogResponseBase(BaseModel, ORMReadMixin):
+    id: UUID
+    admin_user_id: UUID
+    action: str
+    resource_type: str
+    resource_id: Optional[UUID]
+    ip_address: Optional[str]
+    user_agent: Optional[str]
+    session_id: Optional[str]
+    changes: Optional[Dict[str, Any]]
+    metadata: Optional[Dict[str, Any]] = None
+    created_at: EpochDatetime
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+    orm_attribute_map: ClassVar[Dict[str, str]] = {"metadata": "metadata_"}
+
+
+class AdminAuditLogSuccessResponse(AdminAuditLogResponseBase):
+    status: Literal["success"]
+
+
+class AdminAuditLogFailureResponse(AdminAuditLogResponseBase):
+    status: Literal["failed", "denied"]
+    error_message: Optional[str]
+
+
+# Tagged on status so pydantic-core picks the branch without trying each one
+AdminAuditLogResponse = Annotated[
+    Union[AdminAuditLogSuccessResponse, AdminAuditLogFailureResponse],
+    Field(discriminator="status"),
+]
+
+
+def audit_log_response_from_orm(log: Any) -> AdminAuditLogResponseBase:
+    """Build the status-specific audit log response from a stored row without validation"""
+    if log.status == "success":
+        return AdminAuditLogSuccessResponse.from_orm_fast(log)
+    return AdminAuditLogFailureResponse.from_orm_fast(log)
+
+
+class AuditLogQuery(BaseModel):
+    admin_user_id: Optional[UUID] = None
+    action: Optional[str] = None
+    resource_type: Optional[str] = None
+    status: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    limit: int = Field(100, ge=1, le=1000)
+    offset: int = Field(0, ge=0)
+
+
+# ======= List Adapters =======
+# Built once at import so list endpoints serialize whole result sets in a
+# single pydantic-core call instead of per-row model dumps.
+
+AdminAuditLogListAdapter = TypeAdapter(List[AdminAuditLogResponse])
@@ -0,0 +1,77 @@
+"""
+Change management schemas (Module 14)
+"""
+from datetime import datetime
+from typing import Optional, List, Literal, Union, Annotated
+from uuid import UUID
+
+from pydantic import BaseModel, Field, ConfigDict
+
+from app.schemas.base import ORMReadMixin
+from app.schemas.admin.security import SeverityLevel
+
+
+# ======= Shared Types =======
+
+ChangeType = Literal["release", "config", "hotfix", "rollback"]
+ChangeRequestStatus = Literal["draft", "pending", "approved", "rejected", "deployed", "rolled_back"]
+
+
+# ======= ChangeRequest Schemas =======
+
+class ChangeRequestBase(BaseModel):
+    title: str = Field(..., min_length=1, max_length=500)
+    description: str = Field(..., min_length=1)
+    change_type: ChangeType
+    risk_level: SeverityLevel
+    affected_systems: List[str] = Field(..., min_length=1)
+
+
+class ChangeRequestCreate(ChangeRequestBase):
+    rollback_plan: Optional[str] = None
+    scheduled_at: Optional[datetime] = None
+
+
+class ChangeRequestUpdate(BaseModel):
+    status: Optional[ChangeRequestStatus] = None
+    scheduled_at: Optional[datetime] = None
+    rollback_plan: Optional[str] = None
+    deployment_notes: Optional[str] = None
+    was_successful: Optional[bool] = None
+
+
+class ChangeRequestApproval(BaseModel):
+    approve: bool
+    approval_notes: Optional[str] = None
+
+
+class ChangeRequestResponseBase(ChangeRequestBase, ORMReadMixin):
+    id: UUID
+    scheduled_at: Optional[datetime]
+    rollback_plan: Optional[str]
+    approved_by_id: Optional[UUID]
+    approved_at: Optional[datetime]
+    approval_notes: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+    requester_id: UUID
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class ChangeRequestPlannedResponse(ChangeRequestResponseBase):
+    status: Literal["draft", "pending", "approved", "rejected"]
+
+
+class ChangeRequestDeployedResponse(ChangeRequestResponseBase):
+    status: Literal["deployed", "rolled_back"]
+    deployed_at: Optional[datetime]
+    deployment_notes: Optional[str]
+    was_successful: Optional[bool]
+
+
+# Deployment fields are only exposed once a change has been deployed
+ChangeRequestResponse = Annotated[
+    Union[ChangeRequestPlannedResponse, ChangeRequestDeployedResponse],
+    Field(discriminator="status"),
+]
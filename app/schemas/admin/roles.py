@@ -0,0 +1,128 @@
+"""
+Admin role, permission and role-assignment schemas (Module 14)
+"""
+from datetime import datetime
+from typing import Optional, List, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field, ConfigDict
+
+from app.schemas.base import ORMReadMixin
+
+
+# ======= Shared Types =======
+
+AdminRoleCategory = Literal["technical", "security", "business", "audit"]
+
+
+# ======= AdminRole Schemas =======
+
+class AdminRoleBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    display_name: str = Field(..., min_length=1, max_length=255)
+    description: Optional[str] = None
+    category: AdminRoleCategory
+
+
+class AdminRoleCreate(AdminRoleBase):
+    requires_mfa: bool = True
+    max_session_duration: int = Field(28800, ge=1800, le=86400)  # 30min to 24hrs
+
+
+class AdminRoleUpdate(BaseModel):
+    display_name: Optional[str] = None
+    description: Optional[str] = None
+    is_active: Optional[bool] = None
+    requires_mfa: Optional[bool] = None
+    max_session_duration: Optional[int] = Field(None, ge=1800, le=86400)
+
+
+class AdminRoleResponse(AdminRoleBase, ORMReadMixin):
+    id: UUID
+    is_system_role: bool
+    is_active: bool
+    requires_mfa: bool
+    max_session_duration: int
+    created_at: datetime
+    updated_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ======= AdminPermission Schemas =======
+
+class AdminPermissionBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    display_name: str = Field(..., min_length=1, max_length=255)
+    description: Optional[str] = None
+    resource: str = Field(..., min_length=1, max_length=100)
+    action: str = Field(..., min_length=1, max_length=50)
+
+
+class AdminPermissionCreate(AdminPermissionBase):
+    is_dangerous: bool = False
+
+
+class AdminPermissionUpdate(BaseModel):
+    display_name: Optional[str] = None
+    description: Optional[str] = None
+    is_dangerous: Optional[bool] = None
+    is_active: Optional[bool] = None
+
+
+class AdminPermissionResponse(AdminPermissionBase, ORMReadMixin):
+    id: UUID
+    is_dangerous: bool
+    is_active: bool
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ======= AdminUserRole Schemas =======
+
+class AdminUserRoleCreate(BaseModel):
+    admin_user_id: UUID
+    role_id: UUID
+    valid_from: Optional[datetime] = None  # Omitted -> AdminUserRole.valid_from column default
+    valid_until: Optional[datetime] = None
+    approval_reason: Optional[str] = None
+
+
+class AdminUserRoleResponse(BaseModel, ORMReadMixin):
+    id: UUID
+    admin_user_id: UUID
+    role_id: UUID
+    valid_from: datetime
+    valid_until: Optional[datetime]
+    is_approved: bool
+    approved_by_id: Optional[UUID]
+    approved_at: Optional[datetime]
+    assigned_at: datetime
+    revoked_at: Optional[datetime]
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class RoleAssignmentRequest(BaseModel):
+    role_id: UUID
+    valid_until: Optional[datetime] = None
+    reason: str = Field(..., min_length=10)
+
+
+class RoleApprovalRequest(BaseModel):
+    assignment_id: UUID
+    approve: bool
+    notes: Optional[str] = None
+
+
+class RolePermissionAssignment(BaseModel):
+    role_id: UUID
+    permission_ids: List[UUID] = Field(..., min_length=1)
+
+
+class BulkRoleAssignment(BaseModel):
+    admin_user_id: UUID
+    role_ids: List[UUID] = Field(..., min_length=1)
+    valid_until: Optional[datetime] = None
+    reason: str = Field(..., min_length=10)
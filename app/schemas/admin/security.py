@@ -0,0 +1,100 @@
+"""
+Security incident and access review schemas (Module 14)
+"""
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+
+from app.schemas.base import ORMReadMixin
+
+
+# ======= Shared Types =======
+
+SeverityLevel = Literal["critical", "high", "medium", "low"]
+IncidentStatus = Literal["open", "investigating", "resolved", "closed"]
+AccessReviewType = Literal["quarterly", "annual", "ad-hoc"]
+AccessReviewDecisionType = Literal["approve_all", "revoke_some", "revoke_all"]
+
+
+# ======= SecurityIncident Schemas =======
+
+class SecurityIncidentBase(BaseModel):
+    title: str = Field(..., min_length=1, max_length=500)
+    description: str = Field(..., min_length=1)
+    severity: SeverityLevel
+    category: str = Field(..., min_length=1, max_length=100)
+
+
+class SecurityIncidentCreate(SecurityIncidentBase):
+    affected_user_id: Optional[UUID] = None
+    affected_workspace_id: Optional[UUID] = None
+    ip_address: Optional[str] = None
+    evidence: Optional[Dict[str, Any]] = None
+
+
+class SecurityIncidentUpdate(BaseModel):
+    status: Optional[IncidentStatus] = None
+    assigned_to_id: Optional[UUID] = None
+    actions_taken: Optional[List[str]] = None
+    resolution_notes: Optional[str] = None
+
+
+class SecurityIncidentResponse(SecurityIncidentBase, ORMReadMixin):
+    id: UUID
+    status: str
+    assigned_to_id: Optional[UUID]
+    affected_user_id: Optional[UUID]
+    affected_workspace_id: Optional[UUID]
+    ip_address: Optional[str]
+    evidence: Optional[Dict[str, Any]]
+    actions_taken: Optional[List[str]]
+    resolution_notes: Optional[str]
+    resolved_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+    reported_by_id: Optional[UUID]
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ======= AccessReview Schemas =======
+
+class AccessReviewBase(BaseModel):
+    review_period: str = Field(..., min_length=1, max_length=50)
+    review_type: AccessReviewType
+    admin_user_id: UUID
+    roles_reviewed: List[UUID] = Field(..., min_length=1)
+
+
+class AccessReviewCreate(AccessReviewBase):
+    pass
+
+
+class AccessReviewDecision(BaseModel):
+    decision: AccessReviewDecisionType
+    revoked_roles: Optional[List[UUID]] = None
+    review_notes: Optional[str] = None
+    
+    @field_validator('revoked_roles')
+    @classmethod
+    def validate_revoked_roles(cls, v, info):
+        if info.data.get('decision') in ['revoke_some', 'revoke_all'] and not v:
+            raise ValueError("revoked_roles required when decision is revoke_some or revoke_all")
+        return v
+
+
+class AccessReviewResponse(AccessReviewBase, ORMReadMixin):
+    id: UUID
+    status: str
+    reviewer_id: UUID
+    reviewed_at: Optional[datetime]
+    review_notes: Optional[str]
+    decision: Optional[str]
+    roles_reviewed: List[str]  # Stored as strings in JSONB
+    revoked_roles: Optional[List[str]]
+    created_at: datetime
+    updated_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True)
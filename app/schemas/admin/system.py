@@ -0,0 +1,121 @@
+"""
+System configuration, feature flag and admin dashboard schemas (Module 14)
+"""
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+
+from app.schemas.base import ORMReadMixin
+
+
+# ======= Shared Types =======
+
+ConfigDataType = Literal["string", "integer", "boolean", "json"]
+
+
+# ======= SystemConfig Schemas =======
+
+class SystemConfigBase(BaseModel):
+    key: str = Field(..., min_length=1, max_length=255)
+    value: Dict[str, Any]
+    data_type: ConfigDataType
+    category: str = Field(..., min_length=1, max_length=100)
+    description: Optional[str] = None
+    is_sensitive: bool = False
+
+
+class SystemConfigCreate(SystemConfigBase):
+    is_editable: bool = True
+
+
+class SystemConfigUpdate(BaseModel):
+    value: Dict[str, Any]
+    description: Optional[str] = None
+
+
+class SystemConfigResponse(SystemConfigBase, ORMReadMixin):
+    id: UUID
+    is_editable: bool
+    version: int
+    created_at: datetime
+    updated_at: datetime
+    updated_by_id: Optional[UUID]
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ======= FeatureFlag Schemas =======
+
+class FeatureFlagBase(BaseModel):
+    key: str = Field(..., min_length=1, max_length=255)
+    name: str = Field(..., min_length=1, max_length=255)
+    description: Optional[str] = None
+
+
+class FeatureFlagCreate(FeatureFlagBase):
+    is_enabled: bool = False
+    rollout_percentage: int = Field(0, ge=0, le=100)
+    environment: str = "production"
+    expires_at: Optional[datetime] = None
+
+
+class TargetingRules(BaseModel):
+    """Known feature-flag targeting keys; anything else goes in custom_attrs"""
+    min_role: Optional[str] = None
+    countries: Optional[List[str]] = None
+    custom_attrs: Dict[str, Any] = Field(default_factory=dict)
+
+    @model_validator(mode="before")
+    @classmethod
+    def collect_custom_attrs(cls, data: Any) -> Any:
+        """Move unknown top-level keys into custom_attrs instead of dropping them"""
+        if not isinstance(data, dict):
+            return data
+        extra = {key: value for key, value in data.items() if key not in cls.model_fields}
+        if not extra:
+            return data
+        known = {key: value for key, value in data.items() if key in cls.model_fields}
+        known["custom_attrs"] = {**extra, **(known.get("custom_attrs") or {})}
+        return known
+
+
+class FeatureFlagUpdate(BaseModel):
+    is_enabled: Optional[bool] = None
+    rollout_percentage: Optional[int] = Field(None, ge=0, le=100)
+    target_workspaces: Optional[List[UUID]] = None
+    target_users: Optional[List[UUID]] = None
+    targeting_rules: Optional[TargetingRules] = None
+    expires_at: Optional[datetime] = None
+
+
+class FeatureFlagResponse(FeatureFlagBase, ORMReadMixin):
+    id: UUID
+    is_enabled: bool
+    rollout_percentage: int
+    target_workspaces: Optional[List[str]]  # Stored as strings in JSONB
+    target_users: Optional[List[str]]
+    targeting_rules: Optional[TargetingRules]
+    environment: str
+    expires_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+    created_by_id: Optional[UUID]
+    updated_by_id: Optional[UUID]
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ======= Dashboard Schemas =======
+
+class AdminStats(BaseModel):
+    total_admin_users: int
+    active_admin_users: int
+    total_roles: int
+    total_permissions: int
+    pending_change_requests: int
+    open_security_incidents: int
+    pending_access_reviews: int
+    
+    model_config = ConfigDict(frozen=True)
@@ -0,0 +1,64 @@
+"""
+Admin user and login schemas (Module 14)
+"""
+from datetime import datetime
+from typing import Optional, List
+from uuid import UUID
+
+from pydantic import BaseModel, EmailStr, Field, ConfigDict
+
+from app.schemas.base import ORMReadMixin
+from app.schemas.admin.roles import AdminRoleResponse
+
+
+# ======= AdminUser Schemas =======
+
+class AdminUserBase(BaseModel):
+    username: str = Field(..., min_length=3, max_length=100)
+    email: EmailStr
+    full_name: str = Field(..., min_length=1, max_length=255)
+    employee_id: Optional[str] = Field(None, max_length=50)
+    department: Optional[str] = Field(None, max_length=100)
+
+
+class AdminUserCreate(AdminUserBase):
+    password: str = Field(..., min_length=8)
+    mfa_enabled: bool = False
+
+
+class AdminUserUpdate(BaseModel):
+    full_name: Optional[str] = None
+    department: Optional[str] = None
+    mfa_enabled: Optional[bool] = None
+    is_active: Optional[bool] = None
+
+
+class AdminUserResponse(AdminUserBase, ORMReadMixin):
+    id: UUID
+    mfa_enabled: bool
+    is_active: bool
+    is_locked: bool
+    failed_login_attempts: int
+    last_login_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ======= Login Schemas =======
+
+class AdminLoginRequest(BaseModel):
+    username: str
+    password: str
+    mfa_token: Optional[str] = None
+
+
+class AdminLoginResponse(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+    admin_user: AdminUserResponse
+    roles: List[AdminRoleResponse]
+    permissions: List[str]  # List of permission names
+    
+    model_config = ConfigDict(frozen=True)
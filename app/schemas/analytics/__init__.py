@@ -0,0 +1,77 @@
+"""
+Analytics and Reporting Pydantic Schemas for Module 11.
+
+Schemas are split into submodules by area. Names are resolved lazily
+(PEP 562) so ``from app.schemas.analytics import X`` only builds the schemas
+of the submodule that defines ``X``.
+"""
+from importlib import import_module
+
+
+_EXPORTS = {
+    # metrics
+    "MetricSnapshotCreate": "metrics",
+    "MetricSnapshotRead": "metrics",
+    "KPICreate": "metrics",
+    "KPIRead": "metrics",
+    "SprintHealthSummary": "metrics",
+    "TeamVelocitySummary": "metrics",
+    "ResourceUtilizationSummary": "metrics",
+    "TimeTrackingSummary": "metrics",
+    "AnalyticsOverviewRead": "metrics",
+    # sprints
+    "SprintMetricCreate": "sprints",
+    "SprintMetricUpdate": "sprints",
+    "SprintMetricRead": "sprints",
+    "VelocityMetricCreate": "sprints",
+    "VelocityMetricRead": "sprints",
+    "BurndownChartData": "sprints",
+    "VelocityChartData": "sprints",
+    "SprintMetricListAdapter": "sprints",
+    # resources
+    "ResourceAllocationCreate": "resources",
+    "ResourceAllocationRead": "resources",
+    "ResourceHeatmapRead": "resources",
+    # timesheet
+    "TimeEntryCreate": "timesheet",
+    "TimeEntryUpdate": "timesheet",
+    "TimeEntryRead": "timesheet",
+    "TimerControlRequest": "timesheet",
+    "TimesheetCreate": "timesheet",
+    "TimesheetSubmit": "timesheet",
+    "TimesheetApprove": "timesheet",
+    "TimesheetReject": "timesheet",
+    "TimesheetRead": "timesheet",
+    "TimesheetApprovalCreate": "timesheet",
+    "TimesheetApprovalRead": "timesheet",
+    "TimeEntryListAdapter": "timesheet",
+    "TimesheetListAdapter": "timesheet",
+    # reports
+    "FilterExpression": "reports",
+    "CustomReportCreate": "reports",
+    "CustomReportUpdate": "reports",
+    "CustomReportRead": "reports",
+    "ReportExecuteRequest": "reports",
+    "ReportExecuteResponse": "reports",
+    "ReportScheduleCreate": "reports",
+    "ReportScheduleUpdate": "reports",
+    "ReportScheduleRead": "reports",
+    "ReportPermissionCreate": "reports",
+    "ReportPermissionRead": "reports",
+    "FilterListAdapter": "reports",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,138 @@
+"""
+Project metric snapshot, KPI and dashboard overview schemas (Module 11).
+"""
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.base import EpochDatetime, ORMReadMixin
+
+
+# ==================== Metric Snapshot Schemas ====================
+
+class MetricSnapshotCreate(BaseModel):
+    """Create metric snapshot"""
+    project_id: str
+    sprint_id: Optional[str] = None
+    snapshot_date: datetime
+    planned_value: Decimal
+    earned_value: Decimal
+    actual_cost: Decimal
+
+
+class MetricSnapshotRead(BaseModel, ORMReadMixin):
+    """Read metric snapshot"""
+    id: UUID
+    project_id: str
+    sprint_id: Optional[str]
+    snapshot_date: EpochDatetime
+    planned_value: float
+    earned_value: float
+    actual_cost: float
+    cost_performance_index: float
+    schedule_performance_index: float
+    cost_variance: float
+    schedule_variance: float
+    progress_percentage: float
+    on_track: bool
+    health_status: str
+    created_at: EpochDatetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ==================== KPI Schemas ====================
+
+class KPICreate(BaseModel):
+    """Create KPI"""
+    project_id: str
+    sprint_id: Optional[str] = None
+    name: str = Field(..., min_length=1, max_length=255)
+    description: Optional[str] = None
+    kpi_type: str
+    unit: str
+    target_value: float = Field(..., gt=0)
+    start_date: datetime
+    target_date: datetime
+    weight: float = Field(1.0, ge=0.1, le=10.0)
+
+
+class KPIRead(BaseModel, ORMReadMixin):
+    """Read KPI"""
+    id: UUID
+    project_id: str
+    sprint_id: Optional[str]
+    name: str
+    description: Optional[str]
+    kpi_type: str
+    unit: str
+    target_value: float
+    actual_value: Optional[float]
+    current_value: Optional[float]
+    status: str
+    achieved: bool
+    start_date: datetime
+    target_date: datetime
+    weight: float
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ==================== Summary/Aggregation Response Schemas ====================
+
+class SprintHealthSummary(BaseModel):
+    """Health of the active sprint, from its latest metric snapshot"""
+    sprint_id: Optional[str] = None
+    health_status: str
+    on_track: bool
+    progress_percentage: float
+    cost_performance_index: float
+    schedule_performance_index: float
+
+    model_config = ConfigDict(frozen=True)
+
+
+class TeamVelocitySummary(BaseModel):
+    """Recent team velocity"""
+    last_velocity: Optional[float] = None
+    avg_velocity_3_sprints: Optional[float] = None
+    avg_velocity_6_sprints: Optional[float] = None
+    trend: str
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ResourceUtilizationSummary(BaseModel):
+    """Project-wide resource utilization"""
+    team_size: int
+    avg_utilization_percentage: float
+    overloaded_count: int
+    underutilized_count: int
+
+    model_config = ConfigDict(frozen=True)
+
+
+class TimeTrackingSummary(BaseModel):
+    """Logged time for the current period"""
+    total_hours: float
+    billable_hours: float
+    non_billable_hours: float
+    time_entries_count: int
+
+    model_config = ConfigDict(frozen=True)
+
+
+class AnalyticsOverviewRead(BaseModel):
+    """High-level analytics overview for dashboard"""
+    sprint_health: SprintHealthSummary
+    team_velocity: TeamVelocitySummary
+    resource_utilization: ResourceUtilizationSummary
+    time_tracking_summary: TimeTrackingSummary
+    pending_timesheets: int
+    overdue_approvals: int
+
+    model_config = ConfigDict(frozen=True)
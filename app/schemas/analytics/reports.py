@@ -0,0 +1,184 @@
+"""
+Custom report, report schedule and report permission schemas (Module 11).
+
+Validators:
+- Report: Filter logic validation
+"""
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter
+
+from app.db.enums import ReportFormatEnum, ReportScheduleFrequencyEnum
+from app.schemas.base import ORMReadMixin
+
+
+# ==================== Custom Report Schemas ====================
+
+class FilterExpression(BaseModel):
+    """Filter expression for custom reports"""
+    field: str = Field(..., description="Field name: project, assignee, tag, priority, month")
+    operator: str = Field(..., description="eq, ne, gt, lt, in, contains")
+    value: Any = Field(...)
+    logic: Optional[str] = Field(None, description="AND or OR connector")
+
+
+class CustomReportCreate(BaseModel):
+    """Create custom report"""
+    name: str = Field(..., min_length=1, max_length=255)
+    project_id: str
+    description: Optional[str] = None
+    dimensions: List[str] = Field(
+        ...,
+        description="Dimensions: project, assignee, tag, priority, month, status"
+    )
+    metrics: List[str] = Field(
+        ...,
+        description="Metrics: count_tasks, sum_hours, avg_cycle_time, sum_costs"
+    )
+    filters: Optional[List[FilterExpression]] = None
+    visualization_type: str = Field("TABLE", description="TABLE, CHART, HEATMAP")
+    is_public: bool = Field(False)
+    is_template: bool = Field(False)
+
+
+class CustomReportUpdate(BaseModel):
+    """Update custom report"""
+    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    description: Optional[str] = None
+    dimensions: Optional[List[str]] = None
+    metrics: Optional[List[str]] = None
+    filters: Optional[List[FilterExpression]] = None
+    visualization_type: Optional[str] = None
+    is_public: Optional[bool] = None
+
+
+class CustomReportRead(BaseModel, ORMReadMixin):
+    """Read custom report"""
+    id: UUID
+    name: str
+    project_id: str
+    description: Optional[str]
+    created_by: str
+    dimensions: List[str]
+    metrics: List[str]
+    filters: Optional[List[FilterExpression]]
+    visualization_type: str
+    is_public: bool
+    is_template: bool
+    last_run_at: Optional[datetime]
+    last_run_result_size: Optional[int]
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class ReportExecuteRequest(BaseModel):
+    """Request to execute custom report"""
+    report_id: UUID
+    export_format: Optional[ReportFormatEnum] = None
+
+
+class ReportExecuteResponse(BaseModel):
+    """Response from report execution"""
+    report_id: UUID
+    execution_time_ms: int
+    result_count: int
+    data: Optional[List[Dict[str, Any]]] = None
+    download_url: Optional[str] = None
+
+    model_config = ConfigDict(frozen=True)
+
+
+# ==================== Report Schedule Schemas ====================
+
+class ReportScheduleCreate(BaseModel):
+    """Create report schedule"""
+    custom_report_id: str
+    project_id: str
+    frequency: ReportScheduleFrequencyEnum
+    start_date: datetime
+    end_date: Optional[datetime] = None
+    execution_days: Optional[List[int]] = Field(None, description="[1-7] for weekly")
+    execution_time: Optional[str] = Field(None, description="HH:MM format")
+    recipient_emails: List[EmailStr] = Field(..., min_length=1)
+    export_format: ReportFormatEnum = ReportFormatEnum.PDF
+    include_charts: bool = Field(True)
+
+
+class ReportScheduleUpdate(BaseModel):
+    """Update report schedule"""
+    frequency: Optional[ReportScheduleFrequencyEnum] = None
+    execution_days: Optional[List[int]] = None
+    execution_time: Optional[str] = None
+    recipient_emails: Optional[List[EmailStr]] = None
+    export_format: Optional[ReportFormatEnum] = None
+    include_charts: Optional[bool] = None
+    is_active: Optional[bool] = None
+    end_date: Optional[datetime] = None
+
+
+class ReportScheduleRead(BaseModel, ORMReadMixin):
+    """Read report schedule"""
+    id: UUID
+    custom_report_id: str
+    project_id: str
+    created_by: str
+    frequency: ReportScheduleFrequencyEnum
+    is_active: bool
+    start_date: datetime
+    end_date: Optional[datetime]
+    next_run_at: Optional[datetime]
+    last_run_at: Optional[datetime]
+    execution_days: Optional[List[int]]
+    execution_time: Optional[str]
+    recipient_emails: List[str]
+    export_format: ReportFormatEnum
+    include_charts: bool
+    total_runs: int
+    success_runs: int
+    failed_runs: int
+    last_error: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ==================== Report Permission Schemas ====================
+
+class ReportPermissionCreate(BaseModel):
+    """Create report permission"""
+    report_id: str
+    user_id: str
+    permission_level: str = Field(..., description="VIEW, EDIT, SHARE, ADMIN")
+    scope_type: Optional[str] = None
+    scope_id: Optional[str] = None
+    grant_reason: Optional[str] = None
+    expires_at: Optional[datetime] = None
+
+
+class ReportPermissionRead(BaseModel, ORMReadMixin):
+    """Read report permission"""
+    id: UUID
+    report_id: str
+    user_id: str
+    permission_level: str
+    scope_type: Optional[str]
+    scope_id: Optional[str]
+    is_active: bool
+    granted_at: datetime
+    expires_at: Optional[datetime]
+    grant_reason: Optional[str]
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ==================== List Adapters ====================
+# Built once at import so list endpoints serialize whole result sets in a
+# single pydantic-core call instead of per-row model dumps.
+
+FilterListAdapter = TypeAdapter(List[FilterExpression])
@@ -0,0 +1,52 @@
+"""
+Resource allocation schemas (Module 11).
+"""
+from datetime import datetime, date
+from typing import List, Dict, Any
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.base import ORMReadMixin
+
+
+# ==================== Resource Allocation Schemas ====================
+
+class ResourceAllocationCreate(BaseModel):
+    """Create resource allocation record"""
+    user_id: str
+    project_id: str
+    working_capacity_hours: float = Field(8.0, gt=0, description="Working hours per day")
+    assigned_hours: float = Field(0, ge=0)
+    allocation_date: datetime
+
+
+class ResourceAllocationRead(BaseModel, ORMReadMixin):
+    """Read resource allocation"""
+    id: UUID
+    user_id: str
+    project_id: str
+    working_capacity_hours: float
+    assigned_hours: float
+    utilization_percentage: float
+    capacity_status: str  # GREEN, RED, GREY
+    allocation_date: datetime
+    is_overloaded: bool
+    is_underutilized: bool
+    in_progress_hours: float
+    completed_hours: float
+    blocked_hours: float
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class ResourceHeatmapRead(BaseModel):
+    """Heatmap view of resource utilization"""
+    date: date
+    resources: List[Dict[str, Any]] = Field(
+        ...,
+        description="List of {user_id, name, capacity_status, utilization_percentage, assigned_hours}"
+    )
+
+    model_config = ConfigDict(frozen=True)
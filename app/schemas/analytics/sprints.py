@@ -0,0 +1,130 @@
+"""
+Sprint and velocity metric schemas (Module 11).
+"""
+from datetime import datetime
+from typing import Optional, List
+from uuid import UUID
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from app.schemas.base import ORMReadMixin
+
+
+# ==================== Sprint Metrics Schemas ====================
+
+class SprintMetricCreate(BaseModel):
+    """Create sprint metric from sprint data"""
+    sprint_id: str = Field(..., description="Sprint ID")
+    project_id: str = Field(..., description="Project ID")
+    total_story_points: int = Field(0, ge=0)
+    initial_story_points: int = Field(0, ge=0, description="Planned Value")
+    sprint_start_date: datetime
+    sprint_end_date: datetime
+    total_sprint_days: int = Field(14, ge=1)
+
+
+class SprintMetricUpdate(BaseModel):
+    """Update sprint metrics"""
+    completed_story_points: Optional[int] = Field(None, ge=0)
+    remaining_story_points: Optional[int] = Field(None, ge=0)
+    added_story_points: Optional[int] = Field(None, ge=0, description="Scope creep addition")
+    removed_story_points: Optional[int] = Field(None, ge=0)
+    planned_value: Optional[Decimal] = Field(None, ge=0)
+    earned_value: Optional[Decimal] = Field(None, ge=0)
+    actual_cost: Optional[Decimal] = Field(None, ge=0)
+    is_on_track: Optional[bool] = None
+    risk_level: Optional[str] = None
+    notes: Optional[str] = None
+
+
+class SprintMetricRead(BaseModel, ORMReadMixin):
+    """Read sprint metric (full DTO)"""
+    id: UUID
+    sprint_id: str
+    project_id: str
+    total_story_points: int
+    initial_story_points: int
+    completed_story_points: int
+    remaining_story_points: int
+    added_story_points: int
+    removed_story_points: int
+    sprint_start_date: datetime
+    sprint_end_date: datetime
+    days_elapsed: int
+    total_sprint_days: int
+    planned_value: float
+    earned_value: float
+    actual_cost: float
+    cost_performance_index: Optional[float]
+    schedule_performance_index: Optional[float]
+    is_on_track: bool
+    risk_level: str
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ==================== Velocity Metrics Schemas ====================
+
+class VelocityMetricCreate(BaseModel):
+    """Create velocity metric for sprint"""
+    sprint_id: str
+    project_id: str
+    commitment: int = Field(..., gt=0)
+    completed: int = Field(..., ge=0)
+    team_size: int = Field(..., gt=0)
+    sprint_number: int = Field(..., gt=0)
+    sprint_start_date: datetime
+    sprint_end_date: datetime
+
+
+class VelocityMetricRead(BaseModel, ORMReadMixin):
+    """Read velocity metric"""
+    id: UUID
+    sprint_id: str
+    project_id: str
+    commitment: int
+    completed: int
+    velocity: float
+    team_size: int
+    avg_velocity_3_sprints: Optional[float]
+    avg_velocity_6_sprints: Optional[float]
+    trend: str
+    sprint_number: int
+    sprint_start_date: datetime
+    sprint_end_date: datetime
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ==================== Chart Schemas ====================
+
+class BurndownChartData(BaseModel):
+    """Burn-down chart visualization data"""
+    sprint_id: str
+    days: List[int]
+    ideal_line: List[float]
+    actual_line: List[float]
+    scope_line: Optional[List[float]] = None
+    on_track: bool
+    risk_level: str
+
+
+class VelocityChartData(BaseModel):
+    """Velocity trend chart data"""
+    sprints: List[str]
+    commitments: List[int]
+    completed: List[int]
+    velocities: List[float]
+    avg_velocity_3: Optional[float]
+    trend: str
+
+
+# ==================== List Adapters ====================
+# Built once at import so list endpoints serialize whole result sets in a
+# single pydantic-core call instead of per-row model dumps.
+
+SprintMetricListAdapter = TypeAdapter(List[SprintMetricRead])
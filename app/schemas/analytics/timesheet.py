@@ -0,0 +1,202 @@
+"""
+Time entry and timesheet schemas (Module 11).
+
+Validators:
+- Time entry: No future logging, daily <= 24h, warning > 12h
+- Timesheet: Status workflow validation
+"""
+from datetime import datetime, date, timedelta
+from typing import Optional, List, Dict, Any
+from uuid import UUID
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
+
+from app.db.enums import TimesheetStatusEnum, BillableStatusEnum
+from app.schemas.base import EpochDatetime, ORMReadMixin
+
+
+# ==================== Time Entry Schemas ====================
+
+_MAX_ENTRY_DURATION = timedelta(hours=24)
+
+
+class TimeEntryCreate(BaseModel):
+    """Create time entry (timer or manual)"""
+    user_id: str
+    project_id: str
+    task_id: Optional[str] = None
+    start_time: datetime
+    end_time: datetime
+    entry_type: str = Field("TIMER", description="TIMER or MANUAL")
+    is_billable: bool = Field(True)
+    billable_status: BillableStatusEnum = BillableStatusEnum.NON_BILLABLE
+    category: Optional[str] = None
+    description: Optional[str] = None
+
+    @field_validator("end_time")
+    @classmethod
+    def end_after_start(cls, v, info):
+        if "start_time" in info.data and v <= info.data["start_time"]:
+            raise ValueError("end_time must be after start_time")
+        return v
+
+    @field_validator("start_time")
+    @classmethod
+    def no_future_logging(cls, v):
+        """Business Rule: Cannot log time for future dates"""
+        if v.date() > datetime.utcnow().date():
+            raise ValueError("Cannot log time for future dates (except leave requests)")
+        return v
+
+    @model_validator(mode="after")
+    def validate_daily_limits(self):
+        """
+        Business Rule: Validate daily time logging limits
+        - Hard limit: 24h per day
+        - Soft warning (>12h per day) is flagged on the stored entry by the service
+        """
+        if self.end_time - self.start_time > _MAX_ENTRY_DURATION:
+            raise ValueError("Entry exceeds 24-hour daily maximum")
+
+        return self
+
+
+class TimeEntryUpdate(BaseModel):
+    """Update time entry"""
+    end_time: Optional[datetime] = None
+    is_billable: Optional[bool] = None
+    billable_status: Optional[BillableStatusEnum] = None
+    category: Optional[str] = None
+    description: Optional[str] = None
+    edit_reason: Optional[str] = None
+
+
+class TimeEntryRead(BaseModel, ORMReadMixin):
+    """Read time entry"""
+    id: UUID
+    user_id: str
+    project_id: str
+    task_id: Optional[str]
+    start_time: EpochDatetime
+    end_time: EpochDatetime
+    duration_seconds: int
+    duration_hours: float
+    entry_type: str
+    is_billable: bool
+    billable_status: BillableStatusEnum
+    hourly_rate: Optional[Decimal]
+    billable_amount: Optional[Decimal]
+    category: Optional[str]
+    description: Optional[str]
+    daily_warning_exceeded: bool
+    daily_max_exceeded: bool
+    edit_count: int
+    manually_edited: bool
+    created_at: EpochDatetime
+    updated_at: EpochDatetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class TimerControlRequest(BaseModel):
+    """Request to start/stop timer"""
+    user_id: str
+    project_id: str
+    task_id: Optional[str] = None
+    action: str = Field(..., description="START or STOP")
+    category: Optional[str] = None
+    description: Optional[str] = None
+
+
+# ==================== Timesheet Schemas ====================
+
+class TimesheetCreate(BaseModel):
+    """Create timesheet"""
+    user_id: str
+    project_id: str
+    period_start_date: datetime
+    period_end_date: datetime
+    period_type: str = Field("WEEKLY", description="WEEKLY or MONTHLY")
+    notes: Optional[str] = None
+
+
+class TimesheetSubmit(BaseModel):
+    """Submit timesheet for approval"""
+    timesheet_id: UUID
+    notes: Optional[str] = None
+
+
+class TimesheetApprove(BaseModel):
+    """Approve timesheet"""
+    timesheet_id: UUID
+    approval_notes: Optional[str] = None
+
+
+class TimesheetReject(BaseModel):
+    """Reject timesheet"""
+    timesheet_id: UUID
+    rejection_reason: str = Field(..., min_length=10)
+
+
+class TimesheetRead(BaseModel, ORMReadMixin):
+    """Read timesheet"""
+    id: UUID
+    user_id: str
+    project_id: str
+    period_start_date: datetime
+    period_end_date: datetime
+    period_type: str
+    total_hours: float
+    billable_hours: float
+    non_billable_hours: float
+    total_cost: Decimal
+    billable_amount: Decimal
+    time_entries_count: int
+    status: TimesheetStatusEnum
+    submitted_at: Optional[datetime]
+    approved_at: Optional[datetime]
+    rejected_at: Optional[datetime]
+    rejection_reason: Optional[str]
+    notes: Optional[str]
+    approval_notes: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ==================== Timesheet Approval Schemas ====================
+
+class TimesheetApprovalCreate(BaseModel):
+    """Create timesheet approval record"""
+    timesheet_id: UUID
+    validation_passed: bool = False
+
+
+class TimesheetApprovalRead(BaseModel, ORMReadMixin):
+    """Read timesheet approval"""
+    id: UUID
+    timesheet_id: UUID
+    status: TimesheetStatusEnum
+    submitted_at: Optional[datetime]
+    approved_at: Optional[datetime]
+    rejected_at: Optional[datetime]
+    approver_id: Optional[str]
+    approval_notes: Optional[str]
+    rejection_reason: Optional[str]
+    validation_passed: bool
+    validation_errors: Optional[List[Dict[str, Any]]]
+    is_compliant: bool
+    requires_escalation: bool
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# ==================== List Adapters ====================
+# Built once at import so list endpoints serialize whole result sets in a
+# single pydantic-core call instead of per-row model dumps.
+
+TimeEntryListAdapter = TypeAdapter(List[TimeEntryRead])
+TimesheetListAdapter = TypeAdapter(List[TimesheetRead])
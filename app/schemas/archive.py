@@ -7,8 +7,36 @@ data exports, retention policies, and audit logging.
 Ref: Module 8 - Data Archiving and Compliance
 """
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, Literal, Generic, TypeVar, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+
+# ============ Shared Types ============
+
+AuditAction = Literal["CREATE", "READ", "UPDATE", "DELETE", "EXPORT", "ARCHIVE"]
+DeletedEntityType = Literal["project", "task", "comment", "file"]
+ExportStatus = Literal["pending", "processing", "completed", "failed"]
+
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """Paginated response envelope shared by the archive list endpoints"""
+    items: List[T]
+    total: int
+    page: int
+    page_size: int
+    has_more: bool
+
+
+class CursorPage(Page[T], Generic[T]):
+    """Page envelope for keyset-paginated lists; pass next_cursor back as cursor"""
+    # Omitted when paging by cursor: counting the filtered set scans the
+    # whole workspace history on large tables.
+    total: Optional[int] = None
+    page: int = Field(1, description="Deprecated: offset paging; use cursor/next_cursor")
+    next_cursor: Optional[str] = None
 
 
 # ============ Archive Policy Schemas ============
@@ -49,15 +77,14 @@ class ArchivePolicyRead(ArchivePolicyBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============ Deleted Item Schemas ============
 
 class DeletedItemBase(BaseModel):
     """Base schema for deleted items"""
-    entity_type: str = Field(..., description="Type of deleted entity: project, task, comment, file")
+    entity_type: DeletedEntityType = Field(..., description="Type of deleted entity: project, task, comment, file")
     deletion_reason: Optional[str] = Field(None, max_length=255)
 
 
@@ -74,17 +101,10 @@ class DeletedItemRead(DeletedItemBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class DeletedItemListResponse(BaseModel):
-    """Paginated response for deleted items list"""
-    items: List[DeletedItemRead]
-    total: int
-    page: int
-    page_size: int
-    has_more: bool
+DeletedItemListResponse = CursorPage[DeletedItemRead]
 
 
 class RestoreDeletedItemRequest(BaseModel):
@@ -111,17 +131,10 @@ class ArchivedSnapshotRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class ArchivedSnapshotListResponse(BaseModel):
-    """Paginated response for archived snapshots"""
-    items: List[ArchivedSnapshotRead]
-    total: int
-    page: int
-    page_size: int
-    has_more: bool
+ArchivedSnapshotListResponse = CursorPage[ArchivedSnapshotRead]
 
 
 # ============ Data Export Schemas ============
@@ -140,7 +153,7 @@ class DataExportRequestRead(BaseModel):
     requested_by_user_id: str
     export_format: str
     scope: str
-    status: str  # pending, processing, completed, failed
+    status: ExportStatus
     progress_percent: int
     error_message: Optional[str]
     file_size_bytes: Optional[int]
@@ -149,26 +162,24 @@ class DataExportRequestRead(BaseModel):
     completed_at: Optional[datetime]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DataExportResponse(BaseModel):
     """Schema for download response"""
     export_id: str
     download_url: str
+    stream_url: Optional[str] = Field(None, description="NDJSON stream of the export records")
     expires_at: datetime
-    file_size_bytes: Optional[int]
+    file_size_bytes: Optional[int] = Field(
+        None,
+        description="Deprecated: not known until the export is materialized; use stream_url",
+        json_schema_extra={"deprecated": True},
+    )
     format: str
 
 
-class DataExportListResponse(BaseModel):
-    """Paginated response for export requests"""
-    items: List[DataExportRequestRead]
-    total: int
-    page: int
-    page_size: int
-    has_more: bool
+DataExportListResponse = Page[DataExportRequestRead]
 
 
 # ============ Data Retention Policy Schemas ============
@@ -187,15 +198,22 @@ class RetentionPolicyRead(RetentionPolicyBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============ Audit Log Schemas ============
 
+class AuditChange(BaseModel):
+    """Old/new value of a single changed field"""
+    old: Any = None
+    new: Any = None
+
+    model_config = ConfigDict(extra="allow")
+
+
 class AuditLogBase(BaseModel):
     """Base schema for audit logs"""
-    action: str = Field(..., description="CREATE, READ, UPDATE, DELETE, EXPORT, ARCHIVE")
+    action: AuditAction = Field(..., description="CREATE, READ, UPDATE, DELETE, EXPORT, ARCHIVE")
     resource_type: str = Field(..., description="project, task, file, user, etc")
     resource_id: str
     status_code: Optional[str] = Field(None, description="success, failure, error")
@@ -210,21 +228,15 @@ class AuditLogRead(AuditLogBase):
     user_email: Optional[str]
     ip_address: Optional[str]
     user_agent: Optional[str]
-    changes: Optional[Dict[str, Any]]
+    # field -> {old, new}; legacy rows may hold a bare value instead
+    changes: Optional[Dict[str, Union[AuditChange, Any]]]
     logged_at: datetime
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class AuditLogListResponse(BaseModel):
-    """Paginated response for audit logs"""
-    items: List[AuditLogRead]
-    total: int
-    page: int
-    page_size: int
-    has_more: bool
+AuditLogListResponse = CursorPage[AuditLogRead]
 
 
 class AuditLogQueryFilter(BaseModel):
@@ -237,6 +249,7 @@ class AuditLogQueryFilter(BaseModel):
     to_date: Optional[datetime] = None
     page: int = Field(1, ge=1)
     page_size: int = Field(20, ge=1, le=100)
+    cursor: Optional[str] = Field(None, description="Opaque next_cursor from the previous page")
 
 
 # ============ Response Models ============
@@ -265,3 +278,11 @@ class Statistics(BaseModel):
     total_storage_used_mb: float
     oldest_archive_date: Optional[datetime]
     upcoming_purge_count: int
+
+
+# ============ List Adapters ============
+# Validate a whole page of ORM rows in one pydantic-core call; the paginated
+# wrapper is then assembled with model_construct.
+
+DeletedItemListAdapter = TypeAdapter(List[DeletedItemRead])
+AuditLogListAdapter = TypeAdapter(List[AuditLogRead])
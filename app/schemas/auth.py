@@ -2,11 +2,40 @@
 Pydantic schemas for Authentication API endpoints.
 Includes request/response models for auth flows.
 """
-from typing import Optional, List
-from pydantic import BaseModel, EmailStr, Field, model_validator
+from typing import Annotated, Optional, List
+from pydantic import AfterValidator, BaseModel, ConfigDict, EmailStr, Field, StringConstraints, model_validator
 from datetime import datetime
 from uuid import UUID
 
+from app.schemas._examples import example_for
+
+
+def _normalize_email_domain(value: str) -> str:
+    """Lowercase only the domain part, matching how EmailStr stores addresses."""
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+# Lightweight email check for hot auth paths. The pattern runs inside
+# pydantic-core; full EmailStr validation is kept for registration. Only the
+# domain is lowercased so lookups match addresses stored via EmailStr.
+Email = Annotated[
+    str,
+    StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=254),
+    AfterValidator(_normalize_email_domain),
+]
+
+# Canonical 8-4-4-4-12 UUID string for request IDs. Endpoints convert it with
+# UUID(...) before calling the services, whose UUID(as_uuid=True) filters
+# need a uuid.UUID outside PostgreSQL.
+UUIDStr = Annotated[
+    str,
+    StringConstraints(pattern=r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"),
+]
+
+# 6-digit one-time password, shared by the MFA request schemas
+OtpCode = Annotated[str, StringConstraints(pattern=r"^\d{6}$")]
+
 
 # ============= User Registration =============
 
@@ -17,15 +46,7 @@ class UserRegisterRequest(BaseModel):
     password: str = Field(..., min_length=12, description="Password")
     full_name: Optional[str] = Field(None, description="User full name")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "email": "user@example.com",
-                "username": "johndoe",
-                "password": "SecurePass123!",
-                "full_name": "John Doe"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=example_for("UserRegisterRequest"))
 
 
 class UserResponse(BaseModel):
@@ -38,8 +59,7 @@ class UserResponse(BaseModel):
     email_verified_at: Optional[datetime]
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FrontendUserResponse(BaseModel):
@@ -59,22 +79,16 @@ class FrontendUserResponse(BaseModel):
 
 class EmailVerifyRequest(BaseModel):
     """Email verification request"""
-    user_id: UUID = Field(..., description="User ID")
+    user_id: UUIDStr = Field(..., description="User ID")
     token: str = Field(..., description="Verification token from email")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                "token": "verification_token_from_email"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=example_for("EmailVerifyRequest"))
 
 
 class ResendVerificationRequest(BaseModel):
     """Resend email verification request"""
-    user_id: Optional[UUID] = Field(None, description="User ID")
-    email: Optional[EmailStr] = Field(None, description="User email")
+    user_id: Optional[UUIDStr] = Field(None, description="User ID")
+    email: Optional[Email] = Field(None, description="User email")
 
     @model_validator(mode="after")
     def validate_identity(self):
@@ -90,13 +104,7 @@ class LoginRequest(BaseModel):
     email: str = Field(..., min_length=3, max_length=255, description="User email or username")
     password: str = Field(..., description="User password")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "email": "user@example.com",
-                "password": "SecurePass123!"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=example_for("LoginRequest"))
 
 
 class SessionResponse(BaseModel):
@@ -111,25 +119,10 @@ class SessionResponse(BaseModel):
     token_type: str = "bearer"
     mfa_required: bool = False
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                "session_id": "session_id_uuid",
-                "token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                "expires_in": 1800,
-                "user": {
-                    "id": "123e4567-e89b-12d3-a456-426614174000",
-                    "email": "user@example.com",
-                    "username": "johndoe",
-                    "full_name": "John Doe",
-                    "status": "active",
-                    "email_verified_at": "2024-01-30T10:00:00Z",
-                    "created_at": "2024-01-29T10:00:00Z"
-                }
-            }
-        }
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra=example_for("SessionResponse"),
+    )
 
 
 class MFARequiredResponse(BaseModel):
@@ -149,27 +142,20 @@ class MFAEnableResponse(BaseModel):
     qr_code: str = Field(..., description="QR code as data URL")
     backup_codes: List[str] = Field(..., description="Backup codes")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "secret_key": "JBSWY3DPEBLW64TMMQ======",
-                "qr_code": "data:image/png;base64,iVBORw0KGgo...",
-                "backup_codes": ["12345678", "87654321", "11223344"]
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=example_for("MFAEnableResponse"))
 
 
 class MFAConfirmRequest(BaseModel):
     """MFA confirmation request"""
-    otp_code: str = Field(..., pattern=r'^\d{6}$', description="6-digit OTP code")
+    otp_code: OtpCode = Field(..., description="6-digit OTP code")
 
 
 class MFALoginRequest(BaseModel):
     """MFA login request"""
     session_id: Optional[str] = Field(None, description="Session ID from login attempt")
-    email: Optional[EmailStr] = Field(None, description="Email from login step")
-    otp_code: Optional[str] = Field(None, pattern=r'^\d{6}$', description="6-digit OTP code")
-    totp_code: Optional[str] = Field(None, pattern=r'^\d{6}$', description="Frontend alias for OTP code")
+    email: Optional[Email] = Field(None, description="Email from login step")
+    otp_code: Optional[OtpCode] = Field(None, description="6-digit OTP code")
+    totp_code: Optional[OtpCode] = Field(None, description="Frontend alias for OTP code")
     backup_code: Optional[str] = Field(None, description="Backup code (if OTP unavailable)")
 
     @model_validator(mode="after")
@@ -211,12 +197,12 @@ class BackupCodesResponse(BaseModel):
 
 class PasswordResetRequest(BaseModel):
     """Password reset request"""
-    email: EmailStr = Field(..., description="User email")
+    email: Email = Field(..., description="User email")
 
 
 class PasswordResetConfirmRequest(BaseModel):
     """Password reset confirmation request"""
-    user_id: UUID = Field(..., description="User ID")
+    user_id: UUIDStr = Field(..., description="User ID")
     token: str = Field(..., description="Reset token from email")
     new_password: str = Field(..., min_length=12, description="New password")
 
@@ -248,7 +234,7 @@ class SessionListResponse(BaseModel):
 
 class RevokeSessionRequest(BaseModel):
     """Revoke session request"""
-    session_id: UUID = Field(..., description="Session ID to revoke")
+    session_id: UUIDStr = Field(..., description="Session ID to revoke")
 
 
 # ============= OAuth2 =============
@@ -272,13 +258,7 @@ class ErrorResponse(BaseModel):
     detail: str
     error_code: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "detail": "Email already registered",
-                "error_code": "EMAIL_ALREADY_EXISTS"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=example_for("ErrorResponse"))
 
 
 class ValidationErrorResponse(BaseModel):
@@ -294,14 +274,7 @@ class OAuthLoginRequest(BaseModel):
     code: str = Field(..., description="Authorization code from OAuth provider")
     redirect_uri: Optional[str] = Field(None, description="Redirect URI used in OAuth flow")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "provider": "google",
-                "code": "4/0AX4XfWh...",
-                "redirect_uri": "http://localhost:3000/auth/callback"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=example_for("OAuthLoginRequest"))
 
 
 class OAuthUrlResponse(BaseModel):
@@ -309,10 +282,4 @@ class OAuthUrlResponse(BaseModel):
     auth_url: str = Field(..., description="OAuth authorization URL")
     state: str = Field(..., description="State parameter for CSRF protection")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "auth_url": "https://accounts.google.com/o/oauth2/v2/auth?...",
-                "state": "random_state_string"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=example_for("OAuthUrlResponse"))
@@ -0,0 +1,103 @@
+"""
+Shared building blocks for Pydantic schemas.
+"""
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Annotated, Any, ClassVar, Dict, Type
+
+from pydantic import (
+    ConfigDict,
+    PlainSerializer,
+    PlainValidator,
+    StringConstraints,
+    WithJsonSchema,
+)
+
+
+def _to_epoch_seconds(value: datetime) -> float:
+    # Stored timestamps are naive UTC (datetime.utcnow)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+# Datetime emitted as epoch seconds in JSON output, for list-heavy internal
+# responses where ISO strings dominate the payload size.
+EpochDatetime = Annotated[
+    datetime,
+    PlainSerializer(_to_epoch_seconds, return_type=float, when_used="json"),
+]
+
+
+# Shared constrained strings, so common length limits are declared once and
+# every field using them shares the same constraint schema.
+NonEmptyStr = Annotated[str, StringConstraints(min_length=1)]
+Title = Annotated[str, StringConstraints(min_length=1, max_length=255)]
+Slug = Annotated[str, StringConstraints(min_length=1, max_length=200)]
+Locale = Annotated[str, StringConstraints(min_length=2, max_length=10)]
+SearchText = Annotated[str, StringConstraints(min_length=1, max_length=500)]
+# 24-hour "HH:MM" wall-clock time
+ClockTime = Annotated[str, StringConstraints(pattern=r"^(?:[01]\d|2[0-3]):[0-5]\d$")]
+
+
+def enum_by_value(enum_cls: Type[Enum]) -> Any:
+    """
+    Enum type validated through a prebuilt ``{value: member}`` map.
+
+    The default enum validator calls ``enum_cls(value)`` in Python for every
+    element; a dict lookup is several times cheaper for the enum lists that
+    appear on every notification row.
+    """
+    members = {member.value: member for member in enum_cls}
+    expected = ", ".join(repr(value) for value in members)
+
+    def validate(value: Any) -> Enum:
+        try:
+            return members[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"Input should be one of {expected}") from None
+
+    return Annotated[
+        enum_cls,
+        PlainValidator(validate),
+        WithJsonSchema({"title": enum_cls.__name__, "type": "string", "enum": list(members)}),
+    ]
+
+
+class ORMReadMixin:
+    """
+    Mixin for response schemas that are built from trusted ORM rows.
+
+    Rows loaded from the database have already passed validation on the way
+    in, so list endpoints can build responses with ``model_construct`` and
+    skip re-running the validator tree for every row.
+
+    ``orm_attribute_map`` maps schema field names to ORM attribute names for
+    the few columns whose Python attribute differs from the API name (e.g.
+    ``metadata`` is reserved on declarative models and mapped as ``metadata_``).
+
+    The mixin also carries the shared read config, so subclasses only declare
+    what differs (e.g. ``frozen=True``). List it after the model bases:
+    ``class FooRead(FooBase, ORMReadMixin)``.
+    """
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    orm_attribute_map: ClassVar[Dict[str, str]] = {}
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        """
+        Build the schema from an ORM object without validation.
+
+        Loaded column values are read straight from the instance ``__dict__``
+        to skip SQLAlchemy's attribute descriptors; expired or unloaded
+        attributes fall back to ``getattr`` so they still load on demand.
+        """
+        attribute_map = cls.orm_attribute_map
+        state = getattr(obj, "__dict__", {})
+        values = {}
+        for name in cls.model_fields:
+            attr = attribute_map.get(name, name)
+            values[name] = state[attr] if attr in state else getattr(obj, attr)
+        return cls.model_construct(**values)
@@ -10,12 +10,26 @@ Validation and serialization schemas for all collaboration features:
 - Collaborative search
 """
 
-from typing import Optional, List, Dict
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Optional, List, Dict, Literal
 from datetime import datetime
-from pydantic import BaseModel, Field, validator, EmailStr
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, TypeAdapter, computed_field
+from app.core.config import settings
 from app.db.enums import (
     ApprovalStatusEnum, NoteAccessEnum, AttachmentStatusEnum, PublicLinkStatusEnum
 )
+from app.schemas.base import ORMReadMixin
+
+
+# ============ Shared Types ============
+
+_PUBLIC_BASE = f"{settings.FRONTEND_BASE_URL}{settings.PUBLIC_NOTE_PATH}"
+
+SearchEntityType = Literal["comment", "note", "attachment", "task"]
+PresenceStatus = Literal["viewing", "editing", "commenting"]
+CollaborationEventType = Literal["comment_added", "user_typing", "file_uploaded", "approval_changed"]
 
 
 # ============ Comment Schemas ============
@@ -40,12 +54,12 @@ class CommentUpdate(BaseModel):
     reason: Optional[str] = Field(None, description="Reason for edit (audit trail)")
 
 
-class CommentResponse(BaseModel):
+class CommentResponse(BaseModel, ORMReadMixin):
     """Comment response"""
-    id: str
-    task_id: str
-    parent_comment_id: Optional[str]
-    author_id: str
+    id: UUID
+    task_id: UUID
+    parent_comment_id: Optional[UUID]
+    author_id: UUID
     content: str
     mentioned_user_ids: Optional[List[str]]
     edited_at: Optional[datetime]
@@ -56,14 +70,33 @@ class CommentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CommentThreadResponse(CommentResponse):
     """Comment with nested replies"""
     replies: List[CommentResponse] = Field(default_factory=list)
 
+    @classmethod
+    def build_threads(cls, comments: List[Any]) -> List["CommentThreadResponse"]:
+        """
+        Group a flat list of ORM comments into top-level threads.
+
+        Direct replies are attached to their thread by ``parent_comment_id``
+        instead of walking each comment's ``replies`` relationship.
+        """
+        fields = list(CommentResponse.model_fields)
+        threads = {
+            comment.id: cls.model_construct(replies=[], **{name: getattr(comment, name) for name in fields})
+            for comment in comments
+            if comment.parent_comment_id is None
+        }
+        for comment in comments:
+            thread = threads.get(comment.parent_comment_id)
+            if thread is not None:
+                thread.replies.append(CommentResponse.from_orm_fast(comment))
+        return list(threads.values())
+
 
 # ============ Attachment Schemas ============
 
@@ -91,8 +124,7 @@ class AttachmentResponse(BaseModel):
     uploaded_by: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FileVersionResponse(BaseModel):
@@ -105,8 +137,7 @@ class FileVersionResponse(BaseModel):
     checksum: Optional[str]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AttachmentVersionResponse(BaseModel):
@@ -138,12 +169,12 @@ class NoteUpdate(BaseModel):
     order_index: Optional[int] = None
 
 
-class NoteResponse(BaseModel):
+class NoteResponse(BaseModel, ORMReadMixin):
     """Note details"""
-    id: str
-    project_id: Optional[str]
-    parent_note_id: Optional[str]
-    user_id: str
+    id: UUID
+    project_id: Optional[UUID]
+    parent_note_id: Optional[UUID]
+    user_id: UUID
     title: str
     content: str
     access_level: NoteAccessEnum
@@ -155,14 +186,36 @@ class NoteResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NoteTreeResponse(NoteResponse):
     """Note with hierarchy and nested children"""
     children: List['NoteTreeResponse'] = Field(default_factory=list)
 
+    @classmethod
+    def build_forest(cls, notes: List[Any]) -> List["NoteTreeResponse"]:
+        """
+        Link a flat list of ORM notes into trees without recursion.
+
+        Every node is built once with ``model_construct`` and appended to its
+        parent by ``parent_note_id``; notes whose parent is not in the list
+        become roots. Input order is kept among siblings.
+        """
+        fields = list(NoteResponse.model_fields)
+        nodes = {
+            note.id: cls.model_construct(children=[], **{name: getattr(note, name) for name in fields})
+            for note in notes
+        }
+        roots = []
+        for node in nodes.values():
+            parent = nodes.get(node.parent_note_id)
+            if parent is not None:
+                parent.children.append(node)
+            else:
+                roots.append(node)
+        return roots
+
 
 class NoteConvertToTaskRequest(BaseModel):
     """Convert note to task"""
@@ -174,10 +227,10 @@ class NoteConvertToTaskRequest(BaseModel):
 
 # ============ Note Version Schemas ============
 
-class NoteVersionResponse(BaseModel):
+class NoteVersionResponse(BaseModel, ORMReadMixin):
     """Note version details"""
-    id: str
-    note_id: str
+    id: UUID
+    note_id: UUID
     version_number: int
     change_description: Optional[str]
     title: str
@@ -185,10 +238,9 @@ class NoteVersionResponse(BaseModel):
     added_content: Optional[str]
     removed_content: Optional[str]
     created_at: datetime
-    created_by: str
+    created_by: UUID
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NoteVersionDiffRequest(BaseModel):
@@ -245,8 +297,7 @@ class ApprovalRecordResponse(BaseModel):
     invalidated_at: Optional[datetime]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============ Public Link Schemas ============
@@ -266,7 +317,6 @@ class PublicLinkResponse(BaseModel):
     id: str
     note_id: str
     slug: str
-    url: str = Field(None)  # Computed: /public/{slug}
     link_title: Optional[str]
     is_password_protected: bool
     status: PublicLinkStatusEnum
@@ -276,8 +326,12 @@ class PublicLinkResponse(BaseModel):
     auto_update: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @computed_field
+    @cached_property
+    def url(self) -> str:
+        return f"{_PUBLIC_BASE}/{self.slug}"
 
 
 class PublicLinkAccessRequest(BaseModel):
@@ -297,8 +351,7 @@ class SmartBacklinkResponse(BaseModel):
     is_linked: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BacklinkSuggestionResponse(BaseModel):
@@ -322,8 +375,7 @@ class MentionResponse(BaseModel):
     mention_priority: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MentionSuggestion(BaseModel):
@@ -341,7 +393,7 @@ class UserPresenceUpdate(BaseModel):
     """Update user presence"""
     task_id: Optional[str] = None
     note_id: Optional[str] = None
-    status: str = Field("viewing", description="viewing, editing, commenting")
+    status: PresenceStatus = Field("viewing", description="viewing, editing, commenting")
     is_typing: bool = Field(False, description="Is currently typing?")
 
 
@@ -356,8 +408,7 @@ class UserPresenceResponse(BaseModel):
     is_typing: bool
     last_activity_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TaskPresenceResponse(BaseModel):
@@ -384,7 +435,7 @@ class CollaborationSearchRequest(BaseModel):
 class SearchResultItem(BaseModel):
     """Individual search result"""
     id: str
-    entity_type: str  # "comment", "note", "attachment", "task"
+    entity_type: SearchEntityType
     entity_id: str
     title: Optional[str]
     snippet: str  # Preview text with query highlighted
@@ -405,10 +456,13 @@ class CollaborationSearchResponse(BaseModel):
 
 
 # ============ Real-time Collaboration Schemas ============
+# Built and consumed server-side only (WebSocket fan-out), so these are plain
+# slotted dataclasses rather than validated models.
 
-class CollaborationEvent(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CollaborationEvent:
     """WebSocket event for real-time collaboration"""
-    event_type: str  # "comment_added", "user_typing", "file_uploaded", "approval_changed"
+    event_type: CollaborationEventType
     entity_id: str
     entity_type: str
     data: Dict
@@ -416,7 +470,8 @@ class CollaborationEvent(BaseModel):
     user_id: str
 
 
-class TypingIndicator(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TypingIndicator:
     """Typing indicator event"""
     task_id: Optional[str]
     note_id: Optional[str]
@@ -442,8 +497,7 @@ class CollaborationNotificationResponse(BaseModel):
     read_at: Optional[datetime]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MarkNotificationAsReadRequest(BaseModel):
@@ -455,17 +509,17 @@ class MarkNotificationAsReadRequest(BaseModel):
 
 class BulkCommentCreateRequest(BaseModel):
     """Create multiple comments in batch"""
-    comments: List[CommentCreate] = Field(..., min_items=1, max_items=100)
+    comments: List[CommentCreate] = Field(..., min_length=1, max_length=100)
 
 
 class BulkAttachmentUploadRequest(BaseModel):
     """Upload multiple files"""
-    attachments: List[AttachmentCreate] = Field(..., min_items=1, max_items=50)
+    attachments: List[AttachmentCreate] = Field(..., min_length=1, max_length=50)
 
 
 class BulkApprovalRequest(BaseModel):
     """Approve multiple items"""
-    approval_ids: List[str] = Field(..., min_items=1, max_items=100)
+    approval_ids: List[str] = Field(..., min_length=1, max_length=100)
     decision_notes: Optional[str] = Field(None)
     approve: bool = Field(True, description="True: approve, False: reject")
 
@@ -495,3 +549,13 @@ class UserCollaborationStats(BaseModel):
     mentions_received: int
     approvals_given: int
     approvals_pending: int
+
+
+# ============ List Adapters ============
+# Serialize whole lists of responses built with from_orm_fast in one
+# pydantic-core call.
+
+NoteListAdapter = TypeAdapter(List[NoteResponse])
+NoteTreeListAdapter = TypeAdapter(List[NoteTreeResponse])
+CommentThreadListAdapter = TypeAdapter(List[CommentThreadResponse])
+NoteVersionListAdapter = TypeAdapter(List[NoteVersionResponse])
@@ -5,9 +5,10 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 from app.db.enums import ArticleStatus, ArticleVisibilityScope
+from app.schemas.base import Locale, NonEmptyStr, ORMReadMixin, SearchText, Slug, Title
 
 
 # ======= Category Schemas =======
@@ -34,19 +35,17 @@ class CategoryUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
-class CategoryResponse(CategoryBase):
+class CategoryResponse(CategoryBase, ORMReadMixin):
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ======= Article Schemas =======
 
 class ArticleBase(BaseModel):
-    slug: str = Field(..., min_length=1, max_length=200)
-    title: str = Field(..., min_length=1, max_length=255)
+    slug: Slug
+    title: Title
     summary: Optional[str] = None
     category_id: Optional[UUID] = None
     status: ArticleStatus = ArticleStatus.DRAFT
@@ -67,7 +66,7 @@ class ArticleUpdate(BaseModel):
     tag_ids: Optional[List[UUID]] = None
 
 
-class ArticleResponse(ArticleBase):
+class ArticleResponse(ArticleBase, ORMReadMixin):
     id: UUID
     author_id: Optional[UUID]
     published_at: Optional[datetime]
@@ -75,8 +74,6 @@ class ArticleResponse(ArticleBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ======= Article Version Schemas =======
 
@@ -84,14 +81,14 @@ class ArticleVersionCreate(BaseModel):
     article_id: UUID
     version_number: int = 1
     version_label: Optional[str] = None
-    title: str = Field(..., min_length=1, max_length=255)
-    content_raw: str = Field(..., min_length=1)
+    title: Title
+    content_raw: NonEmptyStr
     content_rendered: Optional[str] = None
     changelog_summary: Optional[str] = None
     is_current: bool = True
 
 
-class ArticleVersionResponse(BaseModel):
+class ArticleVersionResponse(BaseModel, ORMReadMixin):
     id: UUID
     article_id: UUID
     version_number: int
@@ -105,20 +102,18 @@ class ArticleVersionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ======= Article Translation Schemas =======
 
 class ArticleTranslationCreate(BaseModel):
     version_id: UUID
-    locale: str = Field(..., min_length=2, max_length=10)
-    title: str = Field(..., min_length=1, max_length=255)
-    content_localized: str = Field(..., min_length=1)
+    locale: Locale
+    title: Title
+    content_localized: NonEmptyStr
     is_default: bool = False
 
 
-class ArticleTranslationResponse(BaseModel):
+class ArticleTranslationResponse(BaseModel, ORMReadMixin):
     id: UUID
     version_id: UUID
     locale: str
@@ -128,7 +123,7 @@ class ArticleTranslationResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
 
 
 # ======= Route Mapping Schemas =======
@@ -142,7 +137,7 @@ class RouteMappingCreate(BaseModel):
     is_active: bool = True
 
 
-class RouteMappingResponse(BaseModel):
+class RouteMappingResponse(BaseModel, ORMReadMixin):
     id: UUID
     article_id: UUID
     route_pattern: str
@@ -153,8 +148,6 @@ class RouteMappingResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ======= Visibility Schemas =======
 
@@ -164,7 +157,7 @@ class ArticleVisibilityCreate(BaseModel):
     allowed_roles: Optional[Dict[str, Any]] = None
 
 
-class ArticleVisibilityResponse(BaseModel):
+class ArticleVisibilityResponse(BaseModel, ORMReadMixin):
     id: UUID
     article_id: UUID
     access_scope: ArticleVisibilityScope
@@ -172,8 +165,6 @@ class ArticleVisibilityResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ======= Feedback Schemas =======
 
@@ -184,7 +175,7 @@ class ArticleFeedbackCreate(BaseModel):
     route_path: Optional[str] = None
 
 
-class ArticleFeedbackResponse(BaseModel):
+class ArticleFeedbackResponse(BaseModel, ORMReadMixin):
     id: UUID
     article_id: UUID
     user_id: Optional[UUID]
@@ -193,18 +184,18 @@ class ArticleFeedbackResponse(BaseModel):
     route_path: Optional[str]
     submitted_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
 
 
 # ======= Failed Search Schemas =======
 
 class FailedSearchCreate(BaseModel):
-    query_text: str = Field(..., min_length=1, max_length=500)
+    query_text: SearchText
     locale: Optional[str] = None
     route_path: Optional[str] = None
 
 
-class FailedSearchResponse(BaseModel):
+class FailedSearchResponse(BaseModel, ORMReadMixin):
     id: UUID
     user_id: Optional[UUID]
     query_text: str
@@ -212,13 +203,13 @@ class FailedSearchResponse(BaseModel):
     route_path: Optional[str]
     searched_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
 
 
 # ======= Search Schemas =======
 
 class SearchQuery(BaseModel):
-    query: str = Field(..., min_length=1)
+    query: NonEmptyStr
     locale: Optional[str] = None
     limit: int = Field(10, ge=1, le=50)
 
@@ -247,3 +238,10 @@ class ContextualSuggestion(BaseModel):
 class ContextualHelpResponse(BaseModel):
     route: str
     suggestions: List[ContextualSuggestion]
+
+
+# ======= List Adapters =======
+
+CategoryListAdapter = TypeAdapter(List[CategoryResponse])
+ArticleListAdapter = TypeAdapter(List[ArticleResponse])
+RouteMappingListAdapter = TypeAdapter(List[RouteMappingResponse])
@@ -6,8 +6,16 @@ Defines request/response models for API tokens, webhooks, OAuth, plugins, and go
 Ref: Module 12 - Integration Ecosystem
 """
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, HttpUrl
+from typing import Annotated, Literal, Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, StringConstraints, TypeAdapter
+
+from app.schemas.base import ORMReadMixin
+
+
+# ============ Shared Types ============
+
+SyncDirection = Literal["uni", "bi"]
+ServiceHealth = Literal["healthy", "degraded", "down"]
 
 
 # ============ API Token Schemas ============
@@ -29,7 +37,7 @@ class ApiTokenUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
-class ApiTokenRead(ApiTokenBase):
+class ApiTokenRead(ApiTokenBase, ORMReadMixin):
     """Schema for reading API token"""
     id: str
     user_id: str
@@ -40,9 +48,6 @@ class ApiTokenRead(ApiTokenBase):
     revoked_at: Optional[datetime]
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class ApiTokenCreateResponse(BaseModel):
@@ -73,15 +78,12 @@ class ApiScopeBase(BaseModel):
     permission_type: str = Field(..., description="Permission type (read, write, delete, admin)")
 
 
-class ApiScopeRead(ApiScopeBase):
+class ApiScopeRead(ApiScopeBase, ORMReadMixin):
     """Schema for reading API scope"""
     id: str
     is_default: bool
     is_deprecated: bool
-    created_at: Optional[datetime]
-    
-    class Config:
-        from_attributes = True
+    created_at: Optional[datetime] = None  # api_scopes has no created_at column
 
 
 class ApiScopeListResponse(BaseModel):
@@ -92,7 +94,7 @@ class ApiScopeListResponse(BaseModel):
 
 # ============ API Usage Log Schemas ============
 
-class ApiUsageLogRead(BaseModel):
+class ApiUsageLogRead(BaseModel, ORMReadMixin):
     """Schema for reading API usage log"""
     id: str
     workspace_id: str
@@ -104,9 +106,8 @@ class ApiUsageLogRead(BaseModel):
     ip_address: Optional[str]
     logged_at: datetime
     error_message: Optional[str]
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(frozen=True)
 
 
 class ApiUsageLogListResponse(BaseModel):
@@ -141,8 +142,12 @@ class WebhookEndpointUpdate(BaseModel):
     timeout_seconds: Optional[int] = None
 
 
-class WebhookEndpointRead(WebhookEndpointBase):
+class WebhookEndpointRead(WebhookEndpointBase, ORMReadMixin):
     """Schema for reading webhook endpoint"""
+    # Stored URLs were validated as HttpUrl on write; skip URL parsing on read
+    payload_url: Annotated[str, StringConstraints(max_length=2048)] = Field(
+        ..., description="Target URL to send webhooks"
+    )
     id: str
     workspace_id: str
     is_active: bool
@@ -150,9 +155,6 @@ class WebhookEndpointRead(WebhookEndpointBase):
     last_delivery_status: Optional[str]
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class WebhookEndpointListResponse(BaseModel):
@@ -165,21 +167,18 @@ class WebhookEndpointListResponse(BaseModel):
 
 # ============ Webhook Event Schemas ============
 
-class WebhookEventRead(BaseModel):
+class WebhookEventRead(BaseModel, ORMReadMixin):
     """Schema for reading webhook event subscription"""
     id: str
     webhook_endpoint_id: str
     event_type: str
     is_subscribed: bool
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 # ============ Webhook Delivery Schemas ============
 
-class WebhookDeliveryRead(BaseModel):
+class WebhookDeliveryRead(BaseModel, ORMReadMixin):
     """Schema for reading webhook delivery history"""
     id: str
     webhook_endpoint_id: str
@@ -192,9 +191,8 @@ class WebhookDeliveryRead(BaseModel):
     delivered_at: Optional[datetime]
     next_retry_at: Optional[datetime]
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(frozen=True)
 
 
 class WebhookDeliveryListResponse(BaseModel):
@@ -207,7 +205,7 @@ class WebhookDeliveryListResponse(BaseModel):
 
 # ============ OAuth App Schemas ============
 
-class OAuthAppRead(BaseModel):
+class OAuthAppRead(BaseModel, ORMReadMixin):
     """Schema for reading OAuth app"""
     id: str
     name: str
@@ -223,9 +221,6 @@ class OAuthAppRead(BaseModel):
     rating_avg: Optional[int]
     install_count: int
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class OAuthAppListResponse(BaseModel):
@@ -255,7 +250,7 @@ class OAuthConnectionUpdate(BaseModel):
     is_sync_enabled: Optional[bool] = None
 
 
-class OAuthConnectionRead(OAuthConnectionBase):
+class OAuthConnectionRead(OAuthConnectionBase, ORMReadMixin):
     """Schema for reading OAuth connection"""
     id: str
     user_id: str
@@ -267,9 +262,6 @@ class OAuthConnectionRead(OAuthConnectionBase):
     external_user_email: Optional[str]
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class OAuthConnectionListResponse(BaseModel):
@@ -289,7 +281,7 @@ class IntegrationBindingBase(BaseModel):
     external_resource_type: str = Field(..., description="External resource type (event, issue, calendar item)")
     external_resource_id: str = Field(..., description="External resource ID")
     field_mappings: Dict[str, str] = Field(..., description="Field mapping {local_field: external_field}")
-    sync_direction: str = Field(default="bi", description="uni or bi")
+    sync_direction: SyncDirection = Field(default="bi", description="uni or bi")
 
 
 class IntegrationBindingCreate(IntegrationBindingBase):
@@ -297,16 +289,13 @@ class IntegrationBindingCreate(IntegrationBindingBase):
     oauth_connection_id: str = Field(..., description="OAuth connection to use")
 
 
-class IntegrationBindingRead(IntegrationBindingBase):
+class IntegrationBindingRead(IntegrationBindingBase, ORMReadMixin):
     """Schema for reading integration binding"""
     id: str
     oauth_connection_id: str
     last_synced_at: Optional[datetime]
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class IntegrationBindingListResponse(BaseModel):
@@ -347,7 +336,7 @@ class PluginUpdate(BaseModel):
     is_deprecated: Optional[bool] = None
 
 
-class PluginRead(PluginBase):
+class PluginRead(PluginBase, ORMReadMixin):
     """Schema for reading plugin"""
     id: str
     is_public: bool
@@ -359,9 +348,6 @@ class PluginRead(PluginBase):
     install_count: int
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class PluginListResponse(BaseModel):
@@ -390,7 +376,7 @@ class PluginInstallationUpdate(BaseModel):
     configuration: Optional[Dict[str, Any]] = None
 
 
-class PluginInstallationRead(PluginInstallationBase):
+class PluginInstallationRead(PluginInstallationBase, ORMReadMixin):
     """Schema for reading plugin installation"""
     id: str
     workspace_id: str
@@ -398,9 +384,8 @@ class PluginInstallationRead(PluginInstallationBase):
     configuration: Optional[Dict[str, Any]]
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(frozen=True)
 
 
 class PluginInstallationListResponse(BaseModel):
@@ -427,7 +412,7 @@ class ConsentGrantCreate(ConsentGrantBase):
     pass
 
 
-class ConsentGrantRead(ConsentGrantBase):
+class ConsentGrantRead(ConsentGrantBase, ORMReadMixin):
     """Schema for reading consent grant"""
     id: str
     user_id: str
@@ -435,9 +420,8 @@ class ConsentGrantRead(ConsentGrantBase):
     revoked_at: Optional[datetime]
     granted_at: datetime
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(frozen=True)
 
 
 class ConsentGrantListResponse(BaseModel):
@@ -465,6 +449,23 @@ class HealthCheckResponse(BaseModel):
     """Health check for integrations"""
     api_available: bool
     webhooks_processing: bool
-    oauth_status: str  # healthy, degraded, down
+    oauth_status: ServiceHealth
     plugins_loaded: int
     last_check_at: datetime
+
+
+# ============ List Adapters ============
+# Built once at import and reused to validate/serialize the items of every
+# list page.
+
+ApiTokenListAdapter = TypeAdapter(List[ApiTokenRead])
+ApiScopeListAdapter = TypeAdapter(List[ApiScopeRead])
+ApiUsageLogListAdapter = TypeAdapter(List[ApiUsageLogRead])
+WebhookEndpointListAdapter = TypeAdapter(List[WebhookEndpointRead])
+WebhookDeliveryListAdapter = TypeAdapter(List[WebhookDeliveryRead])
+OAuthAppListAdapter = TypeAdapter(List[OAuthAppRead])
+OAuthConnectionListAdapter = TypeAdapter(List[OAuthConnectionRead])
+IntegrationBindingListAdapter = TypeAdapter(List[IntegrationBindingRead])
+PluginListAdapter = TypeAdapter(List[PluginRead])
+PluginInstallationListAdapter = TypeAdapter(List[PluginInstallationRead])
+ConsentGrantListAdapter = TypeAdapter(List[ConsentGrantRead])
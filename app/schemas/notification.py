@@ -16,14 +16,21 @@ Schemas:
 - InteractionTrackingRequest: Track user interactions
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Literal, Optional, List, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from app.db.enums import (
     NotificationTypeEnum, NotificationChannelEnum,
     NotificationPriorityEnum, NotificationStatusEnum,
     TemplateLocaleEnum
 )
+from app.schemas.base import ClockTime, ORMReadMixin, enum_by_value
+
+
+# ============ Shared Types ============
+
+Channel = enum_by_value(NotificationChannelEnum)
+NotificationType = enum_by_value(NotificationTypeEnum)
 
 
 # ============ Notification Base Schemas ============
@@ -45,20 +52,20 @@ class NotificationCreate(NotificationBase):
     event_id: str = Field(..., description="Unique event ID for idempotency")
     recipient_id: str = Field(..., description="User ID of notification recipient")
     workspace_id: str = Field(..., description="Workspace context")
-    channels_used: List[NotificationChannelEnum] = Field(
+    channels_used: List[Channel] = Field(
         default=[NotificationChannelEnum.IN_APP],
         description="Delivery channels"
     )
     scheduled_at: Optional[datetime] = None
 
 
-class NotificationRead(NotificationBase):
+class NotificationRead(NotificationBase, ORMReadMixin):
     """Schema for reading a notification."""
     id: str
     recipient_id: str
     workspace_id: str
     event_id: str
-    channels_used: List[NotificationChannelEnum]
+    channels_used: List[Channel]
     status: NotificationStatusEnum
     aggregation_group_id: Optional[str] = None
     aggregated_count: int = 1
@@ -67,8 +74,7 @@ class NotificationRead(NotificationBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True)
 
 
 class NotificationListResponse(BaseModel):
@@ -126,15 +132,14 @@ class NotificationTemplateCreate(NotificationTemplateBase):
     workspace_id: str = Field(..., description="Workspace context")
 
 
-class NotificationTemplateRead(NotificationTemplateBase):
+class NotificationTemplateRead(NotificationTemplateBase, ORMReadMixin):
     """Schema for reading a notification template."""
     id: str
     workspace_id: str
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True)
 
 
 class NotificationTemplateListResponse(BaseModel):
@@ -147,6 +152,9 @@ class NotificationTemplateListResponse(BaseModel):
 
 # ============ Notification Preference Schemas ============
 
+DigestFrequency = Literal["realtime", "hourly", "daily", "weekly"]
+
+
 class NotificationPreferenceBase(BaseModel):
     """Base schema for notification preferences."""
     notifications_enabled: bool = True
@@ -154,11 +162,11 @@ class NotificationPreferenceBase(BaseModel):
     push_enabled: bool = True
     in_app_enabled: bool = True
     enable_digest_batching: bool = True
-    digest_frequency: str = "hourly"  # "realtime", "hourly", "daily", "weekly"
-    unsubscribed_event_types: List[NotificationTypeEnum] = Field(default_factory=list)
+    digest_frequency: DigestFrequency = "hourly"
+    unsubscribed_event_types: List[NotificationType] = Field(default_factory=list)
     quiet_hours_enabled: bool = False
-    quiet_hours_start: Optional[str] = None  # "HH:MM" format
-    quiet_hours_end: Optional[str] = None
+    quiet_hours_start: Optional[ClockTime] = None
+    quiet_hours_end: Optional[ClockTime] = None
 
 
 class NotificationPreferenceCreate(NotificationPreferenceBase):
@@ -174,14 +182,14 @@ class NotificationPreferenceUpdate(BaseModel):
     push_enabled: Optional[bool] = None
     in_app_enabled: Optional[bool] = None
     enable_digest_batching: Optional[bool] = None
-    digest_frequency: Optional[str] = None
-    unsubscribed_event_types: Optional[List[NotificationTypeEnum]] = None
+    digest_frequency: Optional[DigestFrequency] = None
+    unsubscribed_event_types: Optional[List[NotificationType]] = None
     quiet_hours_enabled: Optional[bool] = None
-    quiet_hours_start: Optional[str] = None
-    quiet_hours_end: Optional[str] = None
+    quiet_hours_start: Optional[ClockTime] = None
+    quiet_hours_end: Optional[ClockTime] = None
 
 
-class NotificationPreferenceRead(NotificationPreferenceBase):
+class NotificationPreferenceRead(NotificationPreferenceBase, ORMReadMixin):
     """Schema for reading notification preferences."""
     id: str
     user_id: str
@@ -189,8 +197,7 @@ class NotificationPreferenceRead(NotificationPreferenceBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True)
 
 
 # ============ Watcher Schemas ============
@@ -200,8 +207,8 @@ class WatcherBase(BaseModel):
     entity_type: str = Field(..., description="Entity type: 'task', 'project', etc.")
     entity_id: str = Field(..., description="Entity ID to watch")
     is_watching: bool = True
-    custom_channels: Optional[List[NotificationChannelEnum]] = None
-    notify_on_types: Optional[List[NotificationTypeEnum]] = None
+    custom_channels: Optional[List[Channel]] = None
+    notify_on_types: Optional[List[NotificationType]] = None
 
 
 class WatcherCreate(WatcherBase):
@@ -210,7 +217,7 @@ class WatcherCreate(WatcherBase):
     workspace_id: str = Field(..., description="Workspace ID")
 
 
-class WatcherRead(WatcherBase):
+class WatcherRead(WatcherBase, ORMReadMixin):
     """Schema for reading a watcher."""
     id: str
     user_id: str
@@ -218,8 +225,7 @@ class WatcherRead(WatcherBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True)
 
 
 class WatcherListResponse(BaseModel):
@@ -237,9 +243,12 @@ class WatchToggleRequest(BaseModel):
 
 # ============ Interaction Tracking Schemas ============
 
+InteractionType = Literal["opened", "clicked", "read", "approved", "rejected"]
+
+
 class InteractionLogBase(BaseModel):
     """Base schema for interaction logs."""
-    interaction_type: str = Field(
+    interaction_type: InteractionType = Field(
         ...,
         description="Type of interaction: 'opened', 'clicked', 'read', 'approved', 'rejected'"
     )
@@ -255,15 +264,14 @@ class InteractionTrackingRequest(InteractionLogBase):
     notification_id: str = Field(..., description="Notification ID")
 
 
-class InteractionLogRead(InteractionLogBase):
+class InteractionLogRead(InteractionLogBase, ORMReadMixin):
     """Schema for reading interaction logs."""
     id: str
     notification_id: str
     user_id: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True)
 
 
 class InteractionLogListResponse(BaseModel):
@@ -291,7 +299,7 @@ class EventLogCreate(EventLogBase):
     workspace_id: str = Field(..., description="Workspace ID")
 
 
-class EventLogRead(EventLogBase):
+class EventLogRead(EventLogBase, ORMReadMixin):
     """Schema for reading event logs."""
     id: str
     event_id: str
@@ -300,8 +308,7 @@ class EventLogRead(EventLogBase):
     processed_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True)
 
 
 # ============ Aggregation & Batching Schemas ============
@@ -310,7 +317,7 @@ class AggregationRuleBase(BaseModel):
     """Base schema for aggregation rules."""
     entity_type: str = Field(..., description="Entity type to aggregate (task, project, etc.)")
     entity_id: str = Field(..., description="Entity ID")
-    event_types: List[NotificationTypeEnum] = Field(
+    event_types: List[NotificationType] = Field(
         default_factory=list,
         description="Event types to aggregate"
     )
@@ -321,7 +328,7 @@ class AggregationRuleBase(BaseModel):
 class BatchingPreferenceBase(BaseModel):
     """Schema for batching preferences."""
     enabled: bool = True
-    frequency: str = Field(default="hourly", description="Batching frequency")
+    frequency: DigestFrequency = Field(default="hourly", description="Batching frequency")
     min_items: int = Field(default=2, description="Minimum items to trigger batch")
     max_items: int = Field(default=50, description="Maximum items per batch")
 
@@ -358,3 +365,11 @@ class NotificationError(BaseModel):
     details: Optional[Dict[str, Any]] = None
     retry_count: Optional[int] = None
     next_retry_at: Optional[datetime] = None
+
+
+# ============ List Adapters ============
+
+NotificationListAdapter = TypeAdapter(List[NotificationRead])
+NotificationTemplateListAdapter = TypeAdapter(List[NotificationTemplateRead])
+InteractionLogListAdapter = TypeAdapter(List[InteractionLogRead])
+WatcherListAdapter = TypeAdapter(List[WatcherRead])
@@ -5,9 +5,10 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.db.enums import OnboardingStatus
+from app.schemas.base import ORMReadMixin
 
 
 # ======= Survey Schemas =======
@@ -22,13 +23,11 @@ class OnboardingSurveyCreate(OnboardingSurveyBase):
     pass
 
 
-class OnboardingSurveyResponse(OnboardingSurveyBase):
+class OnboardingSurveyResponse(OnboardingSurveyBase, ORMReadMixin):
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class SurveyQuestionBase(BaseModel):
     survey_id: UUID
@@ -43,13 +42,11 @@ class SurveyQuestionCreate(SurveyQuestionBase):
     pass
 
 
-class SurveyQuestionResponse(SurveyQuestionBase):
+class SurveyQuestionResponse(SurveyQuestionBase, ORMReadMixin):
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class SurveyResponseCreate(BaseModel):
     question_id: UUID
@@ -58,7 +55,7 @@ class SurveyResponseCreate(BaseModel):
     answer_choices: Optional[List[str]] = None
 
 
-class SurveyResponseResponse(BaseModel):
+class SurveyResponseResponse(BaseModel, ORMReadMixin):
     id: UUID
     user_id: UUID
     question_id: UUID
@@ -67,8 +64,6 @@ class SurveyResponseResponse(BaseModel):
     answer_choices: Optional[List[str]]
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ======= Persona Schemas =======
 
@@ -79,14 +74,12 @@ class PersonaProfileCreate(BaseModel):
     preferences: Optional[Dict[str, Any]] = None
 
 
-class PersonaProfileResponse(PersonaProfileCreate):
+class PersonaProfileResponse(PersonaProfileCreate, ORMReadMixin):
     id: UUID
     user_id: UUID
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ======= Flow Schemas =======
 
@@ -101,13 +94,11 @@ class OnboardingFlowCreate(OnboardingFlowBase):
     pass
 
 
-class OnboardingFlowResponse(OnboardingFlowBase):
+class OnboardingFlowResponse(OnboardingFlowBase, ORMReadMixin):
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class FlowStepBase(BaseModel):
     flow_id: UUID
@@ -123,15 +114,13 @@ class FlowStepCreate(FlowStepBase):
     pass
 
 
-class FlowStepResponse(FlowStepBase):
+class FlowStepResponse(FlowStepBase, ORMReadMixin):
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
 
-
-class UserOnboardingStatusResponse(BaseModel):
+class UserOnboardingStatusResponse(BaseModel, ORMReadMixin):
     id: UUID
     user_id: UUID
     flow_id: Optional[UUID]
@@ -144,8 +133,6 @@ class UserOnboardingStatusResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class UserOnboardingStatusUpdate(BaseModel):
     status: Optional[OnboardingStatus] = None
@@ -166,13 +153,11 @@ class ProductTourCreate(ProductTourBase):
     pass
 
 
-class ProductTourResponse(ProductTourBase):
+class ProductTourResponse(ProductTourBase, ORMReadMixin):
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class TourStepBase(BaseModel):
     tour_id: UUID
@@ -188,15 +173,13 @@ class TourStepCreate(TourStepBase):
     pass
 
 
-class TourStepResponse(TourStepBase):
+class TourStepResponse(TourStepBase, ORMReadMixin):
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
-class TourSessionResponse(BaseModel):
+class TourSessionResponse(BaseModel, ORMReadMixin):
     id: UUID
     user_id: UUID
     session_id: UUID
@@ -207,8 +190,6 @@ class TourSessionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ======= Checklist Schemas =======
 
@@ -222,13 +203,11 @@ class OnboardingChecklistCreate(OnboardingChecklistBase):
     pass
 
 
-class OnboardingChecklistResponse(OnboardingChecklistBase):
+class OnboardingChecklistResponse(OnboardingChecklistBase, ORMReadMixin):
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class OnboardingChecklistItemBase(BaseModel):
     checklist_id: UUID
@@ -244,20 +223,18 @@ class OnboardingChecklistItemCreate(OnboardingChecklistItemBase):
     pass
 
 
-class OnboardingChecklistItemResponse(OnboardingChecklistItemBase):
+class OnboardingChecklistItemResponse(OnboardingChecklistItemBase, ORMReadMixin):
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class UserChecklistProgressUpdate(BaseModel):
     item_id: UUID
     is_completed: bool
 
 
-class UserChecklistProgressResponse(BaseModel):
+class UserChecklistProgressResponse(BaseModel, ORMReadMixin):
     id: UUID
     user_id: UUID
     item_id: UUID
@@ -266,8 +243,6 @@ class UserChecklistProgressResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class OnboardingRewardCreate(BaseModel):
     checklist_id: UUID
@@ -277,13 +252,11 @@ class OnboardingRewardCreate(BaseModel):
     is_active: bool = True
 
 
-class OnboardingRewardResponse(OnboardingRewardCreate):
+class OnboardingRewardResponse(OnboardingRewardCreate, ORMReadMixin):
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # ======= Feature Beacon Schemas =======
 
@@ -300,15 +273,13 @@ class FeatureBeaconCreate(FeatureBeaconBase):
     pass
 
 
-class FeatureBeaconResponse(FeatureBeaconBase):
+class FeatureBeaconResponse(FeatureBeaconBase, ORMReadMixin):
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
 
-class UserBeaconStateResponse(BaseModel):
+class UserBeaconStateResponse(BaseModel, ORMReadMixin):
     id: UUID
     user_id: UUID
     beacon_id: UUID
@@ -317,4 +288,8 @@ class UserBeaconStateResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+
+# ======= List Adapters =======
+
+OnboardingSurveyListAdapter = TypeAdapter(List[OnboardingSurveyResponse])
+FeatureBeaconListAdapter = TypeAdapter(List[FeatureBeaconResponse])
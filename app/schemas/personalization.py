@@ -7,9 +7,10 @@ Includes schemas for user settings, dashboard layouts, notification preferences,
 Ref: Module 9 - User Experience Personalization
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from typing_extensions import Annotated, NotRequired, TypedDict
 from uuid import UUID
 
 from app.db.enums import (
@@ -22,6 +23,8 @@ from app.db.enums import (
     NotificationEventTypeEnum,
     TemplateLocaleEnum,
 )
+from app.schemas._examples import example_for
+from app.schemas.base import ClockTime, ORMReadMixin
 
 
 # ============ User Settings Schemas ============
@@ -36,8 +39,8 @@ class UserSettingsBase(BaseModel):
     sidebar_collapsed: Optional[bool] = Field(default=False, description="Sidebar collapsed state")
     color_blindness_mode: Optional[str] = Field(default=ColorBlindnessModeEnum.NORMAL.value, description="Color blindness support mode")
     dnd_enabled: Optional[bool] = Field(default=False, description="Do Not Disturb enabled")
-    dnd_start_time: Optional[str] = Field(default=None, description="DND start time (HH:MM)")
-    dnd_end_time: Optional[str] = Field(default=None, description="DND end time (HH:MM)")
+    dnd_start_time: Optional[ClockTime] = Field(default=None, description="DND start time (HH:MM)")
+    dnd_end_time: Optional[ClockTime] = Field(default=None, description="DND end time (HH:MM)")
 
 
 class UserSettingsCreate(UserSettingsBase):
@@ -50,7 +53,7 @@ class UserSettingsUpdate(UserSettingsBase):
     pass
 
 
-class UserSettingsRead(UserSettingsBase):
+class UserSettingsRead(UserSettingsBase, ORMReadMixin):
     """Schema for reading user settings"""
     id: UUID
     user_id: UUID
@@ -59,20 +62,19 @@ class UserSettingsRead(UserSettingsBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============ Dashboard Layout Schemas ============
 
-class WidgetPosition(BaseModel):
+class WidgetPosition(TypedDict):
     """Individual widget position in grid layout"""
-    id: str = Field(..., description="Widget ID (e.g., 'my-tasks')")
-    x: int = Field(..., ge=0, description="X position in grid")
-    y: int = Field(..., ge=0, description="Y position in grid")
-    w: int = Field(..., ge=1, le=12, description="Width in grid units")
-    h: int = Field(..., ge=1, le=10, description="Height in grid units")
-    visible: bool = Field(default=True, description="Widget visibility")
+    id: Annotated[str, Field(description="Widget ID (e.g., 'my-tasks')")]
+    x: Annotated[int, Field(ge=0, description="X position in grid")]
+    y: Annotated[int, Field(ge=0, description="Y position in grid")]
+    w: Annotated[int, Field(ge=1, le=12, description="Width in grid units")]
+    h: Annotated[int, Field(ge=1, le=10, description="Height in grid units")]
+    visible: NotRequired[bool]
 
 
 class DashboardLayoutBase(BaseModel):
@@ -94,7 +96,7 @@ class DashboardLayoutUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
-class DashboardLayoutRead(DashboardLayoutBase):
+class DashboardLayoutRead(DashboardLayoutBase, ORMReadMixin):
     """Schema for reading dashboard layout"""
     id: UUID
     user_id: UUID
@@ -102,8 +104,7 @@ class DashboardLayoutRead(DashboardLayoutBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class DashboardLayoutListResponse(BaseModel):
@@ -139,15 +140,14 @@ class WidgetConfigUpdate(BaseModel):
     height: Optional[int] = None
 
 
-class WidgetConfigRead(WidgetConfigBase):
+class WidgetConfigRead(WidgetConfigBase, ORMReadMixin):
     """Schema for reading widget config"""
     id: UUID
     user_id: UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class WidgetConfigListResponse(BaseModel):
@@ -199,8 +199,7 @@ class NotificationPreferenceRead(NotificationPreferenceBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class NotificationPreferenceListResponse(BaseModel):
@@ -228,15 +227,14 @@ class KeyboardShortcutUpdate(BaseModel):
     key_combination: Optional[str] = Field(default=None, max_length=100)
 
 
-class KeyboardShortcutRead(KeyboardShortcutBase):
+class KeyboardShortcutRead(KeyboardShortcutBase, ORMReadMixin):
     """Schema for reading keyboard shortcut"""
     id: UUID
     user_id: UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class KeyboardShortcutListResponse(BaseModel):
@@ -250,15 +248,7 @@ class KeyboardShortcutCheatsheet(BaseModel):
     shortcuts: List[Dict[str, str]] = Field(..., description="List of shortcuts with descriptions")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "shortcuts": [
-                    {"key": "Ctrl+K", "action": "Open Command Palette", "context": "Global"},
-                    {"key": "C", "action": "Create Task", "context": "Dashboard"},
-                    {"key": "?", "action": "Show Shortcuts", "context": "Global"},
-                ]
-            }
-        }
+        json_schema_extra = example_for("KeyboardShortcutCheatsheet")
 
 
 # ============ Accessibility Profile Schemas ============
@@ -318,8 +308,7 @@ class AccessibilityProfileRead(AccessibilityProfileBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============ Localization Schemas ============
@@ -343,8 +332,7 @@ class LocalizationStringRead(LocalizationStringBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class LocalizationStringListResponse(BaseModel):
@@ -386,3 +374,8 @@ class PersonalizationPreferencesResponse(BaseModel):
     accessibility: Optional[AccessibilityProfileRead]
     notifications: Dict[str, NotificationPreferenceRead]
     shortcuts: Dict[str, KeyboardShortcutRead]
+
+
+# ============ List Adapters ============
+
+NotificationPreferenceListAdapter = TypeAdapter(List[NotificationPreferenceRead])
@@ -7,7 +7,7 @@ from datetime import datetime, date
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.db.enums import (
     ProjectStatus,
@@ -19,6 +19,15 @@ from app.db.enums import (
     ChangeRequestType,
     ProjectHealthStatus,
 )
+from app.schemas.base import ORMReadMixin
+
+
+def _validate_end_after_start(cls, v, info):
+    """Validate that end_date >= start_date if both are provided"""
+    if v is not None and info.data.get('start_date') is not None:
+        if v < info.data['start_date']:
+            raise ValueError('end_date must be >= start_date')
+    return v
 
 
 # ===== Project Base Schemas =====
@@ -30,14 +39,7 @@ class ProjectBase(BaseModel):
     start_date: Optional[date] = Field(None, description="Project start date")
     end_date: Optional[date] = Field(None, description="Project end date")
     
-    @field_validator('end_date')
-    @classmethod
-    def validate_dates(cls, v, info):
-        """Validate that end_date >= start_date if both are provided"""
-        if v is not None and info.data.get('start_date') is not None:
-            if v < info.data['start_date']:
-                raise ValueError('end_date must be >= start_date')
-        return v
+    validate_dates = field_validator('end_date')(_validate_end_after_start)
 
 
 class ProjectCreate(ProjectBase):
@@ -71,14 +73,7 @@ class ProjectUpdate(BaseModel):
     end_date: Optional[date] = None
     priority: Optional[ProjectPriority] = None
     
-    @field_validator('end_date')
-    @classmethod
-    def validate_dates(cls, v, info):
-        """Validate that end_date >= start_date if both are provided"""
-        if v is not None and info.data.get('start_date') is not None:
-            if v < info.data['start_date']:
-                raise ValueError('end_date must be >= start_date')
-        return v
+    validate_dates = field_validator('end_date')(_validate_end_after_start)
 
 
 class ProjectStatusUpdate(BaseModel):
@@ -102,7 +97,7 @@ class ProjectStatusUpdate(BaseModel):
         return v
 
 
-class ProjectResponse(ProjectBase):
+class ProjectResponse(ProjectBase, ORMReadMixin):
     """Response schema for project"""
     id: UUID
     workspace_id: UUID
@@ -117,8 +112,7 @@ class ProjectResponse(ProjectBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ProjectDetailResponse(ProjectResponse):
@@ -163,8 +157,7 @@ class ProjectMemberResponse(ProjectMemberBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ===== Project Template Schemas =====
@@ -1,12 +1,15 @@
 """
 Pydantic schemas for Project API
 Request/Response models for project operations
+
+Legacy request/list shapes used by ``app.api.project_routes``. Row-level
+response models are re-exported from the canonical ``app.schemas.project``.
 """
 from typing import Optional, List
 from pydantic import BaseModel, Field
-from datetime import datetime, date
 import uuid
-from app.db.enums import ProjectStatus, ProjectVisibility, ProjectGovernanceMode, ProjectPriority
+from app.db.enums import ProjectStatus, ProjectVisibility, ProjectGovernanceMode
+from app.schemas.project import ProjectMemberResponse, ProjectResponse
 
 
 # ==================== PROJECT SCHEMAS ====================
@@ -33,21 +36,6 @@ class ProjectUpdate(BaseModel):
     governance_mode: Optional[ProjectGovernanceMode] = None
 
 
-class ProjectResponse(ProjectBase):
-    """Schema for project response."""
-    id: uuid.UUID
-    workspace_id: uuid.UUID
-    owner_id: uuid.UUID
-    status: ProjectStatus
-    start_date: Optional[date]
-    end_date: Optional[date]
-    created_at: datetime
-    updated_at: datetime
-    
-    class Config:
-        from_attributes = True
-
-
 class ProjectDetailResponse(ProjectResponse):
     """Detailed project response with statistics."""
     task_count: int = Field(description="Total number of tasks")
@@ -60,19 +48,6 @@ class ProjectDetailResponse(ProjectResponse):
 
 # ==================== PROJECT MEMBER SCHEMAS ====================
 
-class ProjectMemberResponse(BaseModel):
-    """Schema for project member."""
-    id: uuid.UUID
-    user_id: uuid.UUID
-    user_email: str
-    user_name: str
-    role: str
-    joined_at: datetime
-    
-    class Config:
-        from_attributes = True
-
-
 class ProjectMemberListResponse(BaseModel):
     """Paginated project member list."""
     items: List[ProjectMemberResponse]
@@ -6,8 +6,10 @@ Core Principles:
 - Least Privilege  
 - Audit-first
 """
+import sys
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 
 from sqlalchemy import or_, and_
@@ -30,7 +32,7 @@ from app.schemas.admin import (
     SecurityIncidentCreate, SecurityIncidentUpdate,
     ChangeRequestCreate, ChangeRequestUpdate, ChangeRequestApproval,
     AccessReviewCreate, AccessReviewDecision,
-    AuditLogQuery
+    AuditLogQuery, AdminStats
 )
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -346,7 +348,9 @@ class AdminRoleAssignmentService:
             .all()
         )
         
-        return [p[0] for p in permissions]
+        # Permission names come from a small, repeating vocabulary; interning
+        # lets every login/permission check share one string object per name.
+        return [sys.intern(p[0]) for p in permissions]
 
 
 class SystemConfigService:
@@ -446,7 +450,13 @@ class FeatureFlagService:
         """Update feature flag"""
         flag = self.get_flag(key)
         
-        for field, value in flag_data.model_dump(exclude_unset=True).items():
+        update_data = flag_data.model_dump(exclude_unset=True)
+        # Target IDs are stored in JSONB as strings
+        for field in ("target_workspaces", "target_users"):
+            if update_data.get(field) is not None:
+                update_data[field] = [str(target_id) for target_id in update_data[field]]
+        
+        for field, value in update_data.items():
             setattr(flag, field, value)
         
         flag.updated_by_id = updated_by_id
@@ -463,7 +473,7 @@ class FeatureFlagService:
             return False
         
         # Check targeted users
-        if flag.target_users and user_id in flag.target_users:
+        if flag.target_users and str(user_id) in flag.target_users:
             return True
         
         # Check rollout percentage (simple hash-based)
@@ -493,8 +503,8 @@ class AuditLogService:
             ip_address=log_data.ip_address,
             user_agent=log_data.user_agent,
             session_id=log_data.session_id,
-            changes=log_data.changes,
-            metadata_=log_data.metadata_,
+            changes=log_data.changes.model_dump() if log_data.changes else None,
+            metadata_=log_data.metadata,
             status=log_data.status,
             error_message=log_data.error_message
         )
@@ -662,7 +672,7 @@ class AccessReviewService:
             review_period=review_data.review_period,
             review_type=review_data.review_type,
             admin_user_id=review_data.admin_user_id,
-            roles_reviewed=review_data.roles_reviewed,
+            roles_reviewed=[str(role_id) for role_id in review_data.roles_reviewed],
             status="pending",
             reviewer_id=reviewer_id
         )
@@ -692,7 +702,7 @@ class AccessReviewService:
         review = self.get_access_review(review_id)
         
         review.decision = decision.decision
-        review.revoked_roles = decision.revoked_roles
+        review.revoked_roles = [str(role_id) for role_id in decision.revoked_roles] if decision.revoked_roles else None
         review.review_notes = decision.review_notes
         review.reviewed_at = datetime.utcnow()
         review.reviewer_id = reviewer_id
@@ -719,3 +729,34 @@ class AccessReviewService:
         self.db.commit()
         self.db.refresh(review)
         return review
+
+
+class AdminStatsService:
+    """Dashboard counters for the admin console"""
+    
+    # Counters only need to be roughly current, so one snapshot is shared
+    # across requests for a few seconds instead of re-running seven counts.
+    CACHE_TTL_SECONDS = 10
+    _cached: Optional[Tuple[float, AdminStats]] = None
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_stats(self) -> AdminStats:
+        """Get admin system statistics (cached for CACHE_TTL_SECONDS)"""
+        cached = AdminStatsService._cached
+        now = time.monotonic()
+        if cached and now - cached[0] < self.CACHE_TTL_SECONDS:
+            return cached[1]
+        
+        stats = AdminStats(
+            total_admin_users=self.db.query(AdminUser).count(),
+            active_admin_users=self.db.query(AdminUser).filter(AdminUser.is_active == True).count(),
+            total_roles=self.db.query(AdminRole).count(),
+            total_permissions=self.db.query(AdminPermission).count(),
+            pending_change_requests=self.db.query(ChangeRequest).filter(ChangeRequest.status == "pending").count(),
+            open_security_incidents=self.db.query(SecurityIncident).filter(SecurityIncident.status == "open").count(),
+            pending_access_reviews=self.db.query(AccessReview).filter(AccessReview.status == "pending").count(),
+        )
+        AdminStatsService._cached = (now, stats)
+        return stats
@@ -34,7 +34,8 @@ from app.schemas.analytics import (
     TimesheetCreate, TimesheetRead,
     CustomReportCreate, CustomReportRead,
     ReportScheduleCreate, ReportScheduleRead,
-    BurndownChartData, VelocityChartData
+    BurndownChartData, VelocityChartData,
+    FilterListAdapter,
 )
 from app.db.enums import TimesheetStatusEnum, BillableStatusEnum
 
@@ -651,7 +652,7 @@ class CustomReportService:
             created_by=created_by,
             dimensions=report_data.dimensions,
             metrics=report_data.metrics,
-            filters=report_data.filters or [],
+            filters=FilterListAdapter.dump_python(report_data.filters or [], mode="json"),
             report_type=AnalyticsTypeEnum.CUSTOM_REPORT,
             visualization_type=report_data.visualization_type,
             is_public=report_data.is_public,
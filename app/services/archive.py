@@ -6,14 +6,15 @@ retention policies, and audit logging.
 
 Ref: Module 8 - Data Archiving and Compliance
 """
+import base64
 import json
 import zipfile
 import io
 from datetime import datetime, timedelta
 from uuid import uuid4
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy import and_, or_, desc, false
 
 from app.models.archive import (
     ArchivePolicy, DeletedItem, ArchivedDataSnapshot, 
@@ -28,6 +29,53 @@ from app.schemas.archive import (
 )
 
 
+def _encode_keyset_cursor(sort_value: datetime, row_id: str) -> str:
+    """Opaque cursor for (timestamp DESC, id DESC) keyset pagination."""
+    raw = f"{sort_value.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_keyset_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        sort_value, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(sort_value), row_id
+    except ValueError:
+        raise ValueError("Invalid pagination cursor")
+
+
+def _keyset_page(query, sort_column, id_column, page: int, page_size: int, cursor: Optional[str]):
+    """
+    Page a query newest-first by (sort_column, id_column).
+
+    With a cursor, filters past the cursor row and skips the total count;
+    otherwise falls back to offset paging. One extra row is fetched to tell
+    whether another page exists. Returns (rows, total, next_cursor).
+    """
+    query = query.order_by(desc(sort_column), desc(id_column))
+    
+    if cursor:
+        sort_value, row_id = _decode_keyset_cursor(cursor)
+        query = query.filter(
+            or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < row_id)
+            )
+        )
+        total = None
+    else:
+        total = query.count()
+        query = query.offset((page - 1) * page_size)
+    
+    rows = query.limit(page_size + 1).all()
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = _encode_keyset_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    
+    return rows, total, next_cursor
+
+
 class ArchiveService:
     """
     Service for automated archiving strategy.
@@ -274,9 +322,15 @@ class TrashBinService:
         workspace_id: str,
         entity_type: Optional[str] = None,
         page: int = 1,
-        page_size: int = 20
-    ) -> tuple[List[DeletedItem], int]:
-        """Get deleted items in trash bin."""
+        page_size: int = 20,
+        cursor: Optional[str] = None
+    ) -> tuple[List[DeletedItem], Optional[int], Optional[str]]:
+        """
+        Get deleted items in trash bin.
+        
+        With a cursor, pages by keyset on (deleted_at, id) and skips the
+        total count. Returns (items, total, next_cursor).
+        """
         query = self.db.query(DeletedItem).filter(
             and_(
                 DeletedItem.workspace_id == workspace_id,
@@ -287,12 +341,7 @@ class TrashBinService:
         if entity_type:
             query = query.filter(DeletedItem.entity_type == entity_type)
         
-        total = query.count()
-        items = query.order_by(
-            desc(DeletedItem.deleted_at)
-        ).offset((page - 1) * page_size).limit(page_size).all()
-        
-        return items, total
+        return _keyset_page(query, DeletedItem.deleted_at, DeletedItem.id, page, page_size, cursor)
     
     def run_auto_purge_job(self, workspace_id: str) -> int:
         """
@@ -335,6 +384,9 @@ class DataExportService:
     Ref: Module 8 - Feature 2.3 - Data Export & Portability
     """
     
+    # Rows per NDJSON chunk and per server-side cursor fetch when streaming
+    STREAM_BATCH_SIZE = 1000
+    
     def __init__(self, db: Session):
         self.db = db
     
@@ -393,30 +445,89 @@ class DataExportService:
         }
         
         # Fetch data based on scope
-        if export_request.scope == "all" or export_request.scope == "workspace":
-            projects = self.db.query(Project).filter(
-                Project.workspace_id == export_request.workspace_id
-            ).all()
-        elif export_request.scope == "projects" and export_request.scope_id:
-            projects = self.db.query(Project).filter(
-                Project.id == export_request.scope_id
-            ).all()
-        else:
-            projects = []
+        projects = self._project_query(
+            export_request.workspace_id, export_request.scope, export_request.scope_id
+        ).all()
         
         # Serialize projects
         for project in projects:
-            export_data["projects"].append({
-                "id": project.id,
-                "name": project.name,
-                "description": project.description,
-                "status": project.status,
-                "created_at": project.created_at.isoformat() if project.created_at else None
-            })
+            export_data["projects"].append(self._serialize_project(project))
         
         # TODO: Fetch and serialize tasks and comments
         
-        return json.dumps(export_data, indent=2).encode('utf-8')
+        return json.dumps(export_data, indent=2, default=str).encode('utf-8')
+    
+    def iter_ndjson_export(
+        self,
+        workspace_id: str,
+        scope: str,
+        scope_id: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """
+        Stream export records as NDJSON, one chunk per STREAM_BATCH_SIZE rows.
+        
+        Rows come from a server-side cursor (yield_per), so peak memory is one
+        batch regardless of export size. Like the JSON export, only projects
+        are exported for now; each line carries ``record_type: "project"``.
+        
+        Ref: Module 8 - Feature 2.3 - Data Export & Portability
+        """
+        query = self._project_query(workspace_id, scope, scope_id)
+        
+        batch = []
+        for project in query.yield_per(self.STREAM_BATCH_SIZE):
+            batch.append(json.dumps(
+                {"record_type": "project", **self._serialize_project(project)},
+                default=str
+            ))
+            if len(batch) >= self.STREAM_BATCH_SIZE:
+                yield ("\n".join(batch) + "\n").encode("utf-8")
+                batch = []
+        
+        if batch:
+            yield ("\n".join(batch) + "\n").encode("utf-8")
+    
+    def _project_query(self, workspace_id: str, scope: str, scope_id: Optional[str]):
+        """Projects covered by an export scope."""
+        if scope == "all" or scope == "workspace":
+            return self.db.query(Project).filter(Project.workspace_id == workspace_id)
+        if scope == "projects" and scope_id:
+            return self.db.query(Project).filter(Project.id == scope_id)
+        return self.db.query(Project).filter(false())
+    
+    @staticmethod
+    def _serialize_project(project: Project) -> Dict[str, Any]:
+        return {
+            "id": project.id,
+            "name": project.name,
+            "description": project.description,
+            "status": project.status,
+            "created_at": project.created_at.isoformat() if project.created_at else None
+        }
+    
+    def get_downloadable_export(self, export_id: str, token: str) -> DataExportRequest:
+        """
+        Fetch an export request after checking its download token and expiry.
+        
+        Raises:
+            ValueError: If the export does not exist, the token does not
+                match, or the download link has expired
+        """
+        import secrets
+        export_request = self.db.query(DataExportRequest).filter(
+            DataExportRequest.id == export_id
+        ).first()
+        
+        if not export_request:
+            raise ValueError(f"Export request {export_id} not found")
+        if not export_request.download_token or not secrets.compare_digest(
+            export_request.download_token, token
+        ):
+            raise ValueError("Invalid download token")
+        if export_request.expires_at and export_request.expires_at < datetime.utcnow():
+            raise ValueError("Download link has expired")
+        
+        return export_request
     
     def update_export_status(
         self,
@@ -551,8 +662,15 @@ class AuditService:
         self,
         workspace_id: str,
         filters: Optional[AuditLogQueryFilter] = None
-    ) -> tuple[List[AuditLog], int]:
-        """Query audit logs with filters."""
+    ) -> tuple[List[AuditLog], Optional[int], Optional[str]]:
+        """
+        Query audit logs with filters.
+        
+        With ``filters.cursor`` set, pages by keyset on (logged_at, id) and
+        skips the total count, so each page is an index range read on
+        ``audit_logs_ws_time_action_idx`` instead of a scan of the filtered set.
+        Returns (logs, total, next_cursor).
+        """
         if filters is None:
             filters = AuditLogQueryFilter()
         
@@ -573,11 +691,6 @@ class AuditService:
         if filters.to_date:
             query = query.filter(AuditLog.logged_at <= filters.to_date)
         
-        total = query.count()
-        logs = query.order_by(
-            desc(AuditLog.logged_at)
-        ).offset((filters.page - 1) * filters.page_size).limit(
-            filters.page_size
-        ).all()
-        
-        return logs, total
+        return _keyset_page(
+            query, AuditLog.logged_at, AuditLog.id, filters.page, filters.page_size, filters.cursor
+        )
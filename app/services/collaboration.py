@@ -143,12 +143,17 @@ class CommentService:
     
     @staticmethod
     def get_comments_for_task(db: Session, task_id: str, include_replies: bool = True) -> List[Comment]:
-        """Get top-level comments for a task with optional nested replies"""
-        comments = db.query(Comment).filter(
-            and_(Comment.task_id == task_id, Comment.parent_comment_id.is_(None))
-        ).order_by(Comment.created_at).all()
+        """
+        Get comments for a task, ordered by creation time
+        
+        With include_replies, replies are returned in the same flat list (one
+        query) for CommentThreadResponse.build_threads to group.
+        """
+        query = db.query(Comment).filter(Comment.task_id == task_id)
+        if not include_replies:
+            query = query.filter(Comment.parent_comment_id.is_(None))
         
-        return comments
+        return query.order_by(Comment.created_at).all()
     
     @staticmethod
     def add_reaction(db: Session, comment_id: str, user_id: str, emoji: str) -> Comment:
@@ -443,6 +448,35 @@ class NoteService:
         db.commit()
         
         return task
+    
+    @staticmethod
+    def get_project_notes(db: Session, project_id: str) -> List[Note]:
+        """
+        Get every note in a project as a flat list (one query)
+        
+        Feature 2.6 AC 2: Nested hierarchy is assembled by the caller from
+        parent_note_id (see NoteTreeResponse.build_forest).
+        """
+        return db.query(Note).filter(
+            Note.project_id == project_id
+        ).order_by(Note.order_index, Note.created_at).all()
+    
+    @staticmethod
+    def get_note_subtree(db: Session, note_id: str) -> List[Note]:
+        """
+        Get a note and all of its descendants as a flat list
+        
+        Uses a recursive CTE so the whole subtree is loaded in one query
+        instead of one lazy load per level.
+        """
+        subtree = db.query(Note.id).filter(Note.id == note_id).cte(name="note_subtree", recursive=True)
+        subtree = subtree.union_all(
+            db.query(Note.id).filter(Note.parent_note_id == subtree.c.id)
+        )
+        
+        return db.query(Note).join(subtree, Note.id == subtree.c.id).order_by(
+            Note.order_index, Note.created_at
+        ).all()
 
 
 class NoteVersionService:
@@ -43,7 +43,8 @@ from app.db.enums import (
 from app.schemas.notification import (
     NotificationCreate, NotificationRead, NotificationTemplateCreate,
     NotificationPreferenceCreate, NotificationPreferenceUpdate,
-    WatcherCreate, InteractionTrackingRequest
+    WatcherCreate, InteractionTrackingRequest,
+    NotificationListAdapter
 )
 
 
@@ -626,7 +627,7 @@ class NotificationService:
             query.order_by(Notification.created_at.desc()).limit(limit).offset(offset)
         ).scalars().all()
         
-        return [NotificationRead.from_orm(n) for n in notifications], total
+        return NotificationListAdapter.validate_python(notifications, from_attributes=True), total
     
     async def mark_as_read(
         self,
@@ -0,0 +1,31 @@
+"""
+Response classes for routes that return Pydantic models directly.
+"""
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+
+class PydanticResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core via ``model_dump_json``.
+
+    Returning a Response instance makes FastAPI skip response_model
+    validation and ``jsonable_encoder``; keep ``response_model`` on the
+    route so the OpenAPI schema is unchanged.
+
+    Pass ``adapter`` to render non-model content such as ``List[XRead]``
+    through a module-level ``TypeAdapter``.
+    """
+
+    def __init__(self, content: Any, *args: Any, adapter: Optional[TypeAdapter] = None, **kwargs: Any) -> None:
+        self.adapter = adapter
+        super().__init__(content, *args, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        if self.adapter is not None:
+            return self.adapter.dump_json(content)
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        return super().render(content)
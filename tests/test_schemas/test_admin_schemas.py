@@ -0,0 +1,35 @@
+"""
+Unit Tests for Admin schemas
+Tests that typed JSON payloads keep keys outside their declared fields.
+"""
+from app.schemas.admin.audit import AuditChanges
+from app.schemas.admin.system import TargetingRules
+
+
+class TestTargetingRules:
+    """Test suite for TargetingRules"""
+
+    def test_unknown_keys_move_to_custom_attrs(self):
+        """Test that unknown targeting keys are kept in custom_attrs"""
+        rules = TargetingRules.model_validate({"min_role": "admin", "beta_cohort": "A"})
+
+        assert rules.min_role == "admin"
+        assert rules.custom_attrs == {"beta_cohort": "A"}
+
+    def test_explicit_custom_attrs_are_merged(self):
+        """Test that explicit custom_attrs win over loose keys of the same name"""
+        rules = TargetingRules.model_validate(
+            {"beta_cohort": "A", "plan": "free", "custom_attrs": {"plan": "pro"}}
+        )
+
+        assert rules.custom_attrs == {"beta_cohort": "A", "plan": "pro"}
+
+
+class TestAuditChanges:
+    """Test suite for AuditChanges"""
+
+    def test_extra_keys_are_kept(self):
+        """Test that audit payload keys besides before/after survive a round-trip"""
+        changes = AuditChanges.model_validate({"before": {"a": 1}, "after": {"a": 2}, "fields": ["a"]})
+
+        assert changes.model_dump() == {"before": {"a": 1}, "after": {"a": 2}, "fields": ["a"]}
@@ -0,0 +1,46 @@
+"""
+Unit Tests for archive schemas
+Tests that legacy audit log rows still validate.
+"""
+from datetime import datetime
+
+from app.schemas.archive import AuditChange, AuditLogRead
+
+
+def _audit_log(changes):
+    return AuditLogRead(
+        id="log-1",
+        workspace_id="workspace-1",
+        user_id=None,
+        user_email=None,
+        ip_address=None,
+        user_agent=None,
+        action="UPDATE",
+        resource_type="task",
+        resource_id="task-1",
+        changes=changes,
+        logged_at=datetime(2024, 1, 1),
+        created_at=datetime(2024, 1, 1),
+    )
+
+
+class TestAuditLogChanges:
+    """Test suite for AuditLogRead.changes"""
+
+    def test_old_new_entry_is_parsed(self):
+        """Test that a regular {old, new} entry becomes an AuditChange"""
+        log = _audit_log({"title": {"old": "A", "new": "B"}})
+
+        assert log.changes["title"] == AuditChange(old="A", new="B")
+
+    def test_extra_keys_are_kept(self):
+        """Test that extra keys on a change entry are kept, not dropped"""
+        log = _audit_log({"title": {"old": "A", "new": "B", "source": "import"}})
+
+        assert log.model_dump()["changes"]["title"] == {"old": "A", "new": "B", "source": "import"}
+
+    def test_legacy_scalar_entries_are_kept(self):
+        """Test that bare legacy values do not fail validation of the row"""
+        log = _audit_log({"status": "DONE", "tags": ["a"], "owner": None})
+
+        assert log.model_dump()["changes"] == {"status": "DONE", "tags": ["a"], "owner": None}
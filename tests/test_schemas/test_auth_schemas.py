@@ -0,0 +1,104 @@
+"""
+Unit Tests for Auth request schemas
+Tests the lightweight field types used on auth requests.
+"""
+import uuid
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.auth import (
+    EmailVerifyRequest,
+    MFAConfirmRequest,
+    MFALoginRequest,
+    PasswordResetRequest,
+    RevokeSessionRequest,
+    ResendVerificationRequest,
+    UserRegisterRequest,
+)
+
+
+class TestEmailType:
+    """Test suite for the Email field type"""
+
+    def test_keeps_local_part_case(self):
+        """Test that only the domain is lowercased"""
+        request = PasswordResetRequest(email="John.Doe@EXAMPLE.com")
+
+        assert request.email == "John.Doe@example.com"
+
+    def test_matches_registration_normalization(self):
+        """Test that lookups see the same address registration stored"""
+        registered = UserRegisterRequest(
+            email="John.Doe@Example.com",
+            username="johndoe",
+            password="a-long-password",
+        )
+
+        assert PasswordResetRequest(email="John.Doe@Example.com").email == registered.email
+        assert ResendVerificationRequest(email="John.Doe@Example.com").email == registered.email
+        assert MFALoginRequest(email="John.Doe@Example.com", otp_code="123456").email == registered.email
+
+    @pytest.mark.parametrize("value", ["not-an-email", "a@b", "a b@example.com", "@example.com"])
+    def test_rejects_malformed_address(self, value):
+        """Test that malformed addresses are rejected"""
+        with pytest.raises(ValidationError):
+            PasswordResetRequest(email=value)
+
+    def test_rejects_overlong_address(self):
+        """Test the 254 character limit"""
+        with pytest.raises(ValidationError):
+            PasswordResetRequest(email=f"{'a' * 250}@example.com")
+
+
+class TestUUIDStrType:
+    """Test suite for the UUIDStr field type"""
+
+    def test_accepts_canonical_uuid_as_str(self):
+        """Test that a canonical UUID is kept as the same string"""
+        value = str(uuid.uuid4())
+
+        request = EmailVerifyRequest(user_id=value, token="t")
+
+        assert request.user_id == value
+        assert isinstance(request.user_id, str)
+
+    def test_accepts_uppercase_hex(self):
+        """Test that uppercase hex digits are accepted"""
+        value = str(uuid.uuid4()).upper()
+
+        assert RevokeSessionRequest(session_id=value).session_id == value
+
+    @pytest.mark.parametrize("value", [
+        "not-a-uuid",
+        uuid.uuid4().hex,
+        "{%s}" % uuid.uuid4(),
+        str(uuid.uuid4())[:-1],
+        str(uuid.uuid4()) + "0",
+    ])
+    def test_rejects_non_canonical_forms(self, value):
+        """Test that only the dashed 36 character form is accepted"""
+        with pytest.raises(ValidationError):
+            RevokeSessionRequest(session_id=value)
+
+
+class TestOtpCodeType:
+    """Test suite for the OtpCode field type"""
+
+    def test_accepts_six_digits(self):
+        """Test that a 6-digit code is accepted"""
+        assert MFAConfirmRequest(otp_code="012345").otp_code == "012345"
+
+    @pytest.mark.parametrize("value", ["12345", "1234567", "12a456", " 123456", ""])
+    def test_rejects_other_shapes(self, value):
+        """Test that anything but exactly six digits is rejected"""
+        with pytest.raises(ValidationError):
+            MFAConfirmRequest(otp_code=value)
+
+    def test_totp_alias_is_checked_and_copied(self):
+        """Test that totp_code uses the same check and fills otp_code"""
+        request = MFALoginRequest(email="a@example.com", totp_code="654321")
+
+        assert request.otp_code == "654321"
+        with pytest.raises(ValidationError):
+            MFALoginRequest(email="a@example.com", totp_code="65432")
@@ -0,0 +1,154 @@
+"""
+Unit Tests for shared schema helpers
+Tests the helpers in app.schemas.base that other schema modules build on.
+"""
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+
+from app.schemas.base import ClockTime, ORMReadMixin, enum_by_value
+
+
+ClockTimeAdapter = TypeAdapter(ClockTime)
+
+
+class _Color(str, Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class _ColorsRead(BaseModel):
+    colors: List[enum_by_value(_Color)]
+
+
+class _Row:
+    """Stand-in for an ORM instance with one lazily loaded attribute"""
+
+    def __init__(self, **columns):
+        self.__dict__.update(columns)
+
+    @property
+    def lazy_total(self):
+        return 42
+
+
+class _RowRead(BaseModel, ORMReadMixin):
+    id: str
+    name: str
+    metadata: Optional[dict] = None
+    created_at: datetime
+
+
+class _RowWithLazyRead(BaseModel, ORMReadMixin):
+    id: str
+    lazy_total: int
+
+
+class TestFromOrmFast:
+    """Test suite for ORMReadMixin.from_orm_fast"""
+
+    def test_copies_loaded_columns(self):
+        """Test that loaded column values are copied as-is"""
+        created_at = datetime(2024, 1, 1)
+        row = _Row(id="1", name="Row", metadata=None, created_at=created_at)
+
+        result = _RowRead.from_orm_fast(row)
+
+        assert result == _RowRead(id="1", name="Row", created_at=created_at)
+        assert result.model_fields_set == {"id", "name", "metadata", "created_at"}
+
+    def test_orm_attribute_map(self):
+        """Test that mapped field names read the renamed ORM attribute"""
+
+        class MappedRead(_RowRead):
+            orm_attribute_map = {"metadata": "metadata_"}
+
+        row = _Row(id="1", name="Row", metadata_={"k": "v"}, created_at=datetime(2024, 1, 1))
+
+        assert MappedRead.from_orm_fast(row).metadata == {"k": "v"}
+
+    def test_falls_back_to_getattr(self):
+        """Test that attributes missing from __dict__ still load through getattr"""
+        row = _Row(id="1")
+
+        assert _RowWithLazyRead.from_orm_fast(row).lazy_total == 42
+
+    def test_skips_validation(self):
+        """Test that values are not coerced, since rows are trusted"""
+        row = _Row(id=1, name="Row", metadata=None, created_at="not-a-datetime")
+
+        result = _RowRead.from_orm_fast(row)
+
+        assert result.id == 1
+        assert result.created_at == "not-a-datetime"
+
+
+class TestORMReadMixinConfig:
+    """Test suite for the read config carried by ORMReadMixin"""
+
+    def test_model_validate_reads_attributes(self):
+        """Test that subclasses validate ORM objects without declaring from_attributes"""
+        row = _Row(id="1", name="Row", metadata=None, created_at=datetime(2024, 1, 1))
+
+        assert _RowRead.model_validate(row).name == "Row"
+
+    def test_subclass_config_is_merged(self):
+        """Test that a subclass override keeps the shared read config"""
+
+        class FrozenRead(_RowRead):
+            model_config = ConfigDict(frozen=True)
+
+        assert FrozenRead.model_config["from_attributes"] is True
+        assert FrozenRead.model_config["populate_by_name"] is True
+        assert FrozenRead.model_config["frozen"] is True
+
+
+class TestClockTime:
+    """Test suite for the ClockTime type"""
+
+    @pytest.mark.parametrize("value", ["00:00", "09:30", "19:05", "23:59"])
+    def test_accepts_24_hour_times(self, value):
+        """Test that valid HH:MM times are accepted unchanged"""
+        assert ClockTimeAdapter.validate_python(value) == value
+
+    @pytest.mark.parametrize("value", ["24:00", "12:60", "7:00", "07:0", "0700", "07:00:00", "ab:cd", ""])
+    def test_rejects_other_shapes(self, value):
+        """Test that out-of-range or non HH:MM strings are rejected"""
+        with pytest.raises(ValidationError):
+            ClockTimeAdapter.validate_python(value)
+
+
+class TestEnumByValue:
+    """Test suite for enum_by_value"""
+
+    def test_returns_enum_members(self):
+        """Test that values map to the enum members themselves"""
+        result = _ColorsRead(colors=["red", "green", "red"])
+
+        assert result.colors == [_Color.RED, _Color.GREEN, _Color.RED]
+        assert all(isinstance(color, _Color) for color in result.colors)
+
+    def test_accepts_members(self):
+        """Test that enum members are accepted as their own value"""
+        assert _ColorsRead(colors=[_Color.GREEN]).colors == [_Color.GREEN]
+
+    @pytest.mark.parametrize("value", ["blue", "RED", 1, None, ["red"]])
+    def test_rejects_unknown_values(self, value):
+        """Test that unknown or unhashable values raise a validation error"""
+        with pytest.raises(ValidationError) as exc_info:
+            _ColorsRead(colors=[value])
+
+        assert "'red', 'green'" in str(exc_info.value)
+
+    def test_serializes_to_values(self):
+        """Test that JSON output uses the enum values"""
+        assert _ColorsRead(colors=["green"]).model_dump_json() == '{"colors":["green"]}'
+
+    def test_json_schema_lists_values(self):
+        """Test that the OpenAPI schema lists the allowed values"""
+        schema = TypeAdapter(enum_by_value(_Color)).json_schema()
+
+        assert schema == {"title": "_Color", "type": "string", "enum": ["red", "green"]}
@@ -0,0 +1,151 @@
+"""
+Unit Tests for collaboration response schemas
+Tests comment thread and note tree assembly from flat ORM rows.
+"""
+import json
+import warnings
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.db.enums import NoteAccessEnum
+from app.schemas.collaboration import (
+    CommentThreadListAdapter,
+    CommentThreadResponse,
+    NoteTreeListAdapter,
+    NoteTreeResponse,
+)
+
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _comment(parent=None, minutes=0):
+    created_at = BASE_TIME + timedelta(minutes=minutes)
+    return SimpleNamespace(
+        id=uuid4(),
+        task_id=uuid4(),
+        parent_comment_id=parent.id if parent is not None else None,
+        author_id=uuid4(),
+        content="Comment",
+        mentioned_user_ids=None,
+        edited_at=None,
+        edit_count=0,
+        reply_count=0,
+        is_pinned=False,
+        reactions=None,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+def _note(parent=None, parent_note_id=None):
+    return SimpleNamespace(
+        id=uuid4(),
+        project_id=uuid4(),
+        parent_note_id=parent.id if parent is not None else parent_note_id,
+        user_id=uuid4(),
+        title="Note",
+        content="Content",
+        access_level=NoteAccessEnum.PRIVATE,
+        is_template=False,
+        template_name=None,
+        is_pinned=False,
+        view_count=0,
+        comment_count=0,
+        created_at=BASE_TIME,
+        updated_at=BASE_TIME,
+    )
+
+
+def _dump_without_warnings(adapter, value):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        return json.loads(adapter.dump_json(value))
+
+
+class TestBuildThreads:
+    """Test suite for CommentThreadResponse.build_threads"""
+
+    def test_replies_keep_input_order(self):
+        """Test that threads and their replies follow the input order"""
+        first = _comment(minutes=0)
+        second = _comment(minutes=1)
+        first_reply = _comment(parent=first, minutes=2)
+        second_reply = _comment(parent=first, minutes=3)
+
+        threads = CommentThreadResponse.build_threads([first, second, first_reply, second_reply])
+
+        assert [thread.id for thread in threads] == [first.id, second.id]
+        assert [reply.id for reply in threads[0].replies] == [first_reply.id, second_reply.id]
+        assert threads[1].replies == []
+
+    def test_orphaned_reply_is_dropped(self):
+        """Test that a reply whose parent is not in the list is not shown as a thread"""
+        root = _comment()
+        orphan = _comment(parent=_comment())
+
+        threads = CommentThreadResponse.build_threads([root, orphan])
+
+        assert [thread.id for thread in threads] == [root.id]
+        assert threads[0].replies == []
+
+    def test_dump_json_serializes_uuid_ids(self):
+        """Test that UUID column values serialize without warnings"""
+        root = _comment()
+        reply = _comment(parent=root)
+
+        data = _dump_without_warnings(
+            CommentThreadListAdapter, CommentThreadResponse.build_threads([root, reply])
+        )
+
+        assert data[0]["id"] == str(root.id)
+        assert data[0]["replies"][0]["parent_comment_id"] == str(root.id)
+
+
+class TestBuildForest:
+    """Test suite for NoteTreeResponse.build_forest"""
+
+    def test_children_keep_input_order(self):
+        """Test that siblings keep their input order at every level"""
+        root = _note()
+        first = _note(parent=root)
+        second = _note(parent=root)
+        grandchild = _note(parent=first)
+
+        forest = NoteTreeResponse.build_forest([root, second, first, grandchild])
+
+        assert [node.id for node in forest] == [root.id]
+        assert [child.id for child in forest[0].children] == [second.id, first.id]
+        assert [child.id for child in forest[0].children[1].children] == [grandchild.id]
+
+    def test_orphaned_note_becomes_root(self):
+        """Test that a note whose parent is not in the list is kept as a root"""
+        root = _note()
+        orphan = _note(parent_note_id=uuid4())
+
+        forest = NoteTreeResponse.build_forest([root, orphan])
+
+        assert [node.id for node in forest] == [root.id, orphan.id]
+
+    def test_subtree_below_top_level(self):
+        """Test a subtree whose root has a parent outside the list"""
+        top = _note()
+        subtree_root = _note(parent=top)
+        child = _note(parent=subtree_root)
+
+        # Children may sort ahead of their parent in the subtree query
+        forest = NoteTreeResponse.build_forest([child, subtree_root])
+
+        assert [node.id for node in forest] == [subtree_root.id]
+        assert [node.id for node in forest[0].children] == [child.id]
+
+    def test_dump_json_serializes_uuid_ids(self):
+        """Test that UUID column values serialize without warnings"""
+        root = _note()
+        child = _note(parent=root)
+
+        data = _dump_without_warnings(NoteTreeListAdapter, NoteTreeResponse.build_forest([root, child]))
+
+        assert data[0]["id"] == str(root.id)
+        assert data[0]["children"][0]["parent_note_id"] == str(root.id)
@@ -0,0 +1,269 @@
+"""
+Unit Tests for Archive keyset pagination
+Tests cursor encoding, trash bin and audit log paging, and cursor errors.
+"""
+import base64
+import pytest
+from unittest.mock import Mock
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy import Column, MetaData, Table, create_engine
+from sqlalchemy.orm import registry, sessionmaker
+
+from app.api.v1.endpoints import archive as archive_endpoints
+from app.models.archive import DeletedItem, AuditLog
+from app.schemas.archive import AuditLogQueryFilter
+from app.services import archive as archive_service
+from app.services.archive import (
+    AuditService,
+    TrashBinService,
+    _decode_keyset_cursor,
+    _encode_keyset_cursor,
+)
+
+
+WORKSPACE_ID = str(uuid4())
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class StandInDeletedItem:
+    """Mapped copy of ``deleted_items`` used in place of DeletedItem."""
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+class StandInAuditLog(StandInDeletedItem):
+    """Mapped copy of ``audit_logs`` used in place of AuditLog."""
+
+
+def _copy_table(table, metadata):
+    # Same columns, types and defaults, minus foreign keys and indexes, so
+    # the table can be created without the rest of the schema.
+    return Table(
+        table.name,
+        metadata,
+        *[
+            Column(
+                column.name,
+                column.type,
+                primary_key=column.primary_key,
+                nullable=column.nullable,
+                default=column.default,
+                server_default=column.server_default,
+            )
+            for column in table.columns
+        ],
+    )
+
+
+@pytest.fixture(scope="module")
+def archive_db():
+    """
+    In-memory session over stand-in archive tables.
+
+    The shared ``db`` fixture cannot build the full schema, so the paging
+    queries run against copies of the real archive table columns.
+    """
+    metadata = MetaData()
+    mapper_registry = registry(metadata=metadata)
+    mapper_registry.map_imperatively(StandInDeletedItem, _copy_table(DeletedItem.__table__, metadata))
+    mapper_registry.map_imperatively(StandInAuditLog, _copy_table(AuditLog.__table__, metadata))
+
+    engine = create_engine("sqlite:///:memory:")
+    metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    mapper_registry.dispose()
+    engine.dispose()
+
+
+@pytest.fixture
+def stand_in_models(monkeypatch, archive_db):
+    """Point the archive services at the stand-in mappings."""
+    monkeypatch.setattr(archive_service, "DeletedItem", StandInDeletedItem)
+    monkeypatch.setattr(archive_service, "AuditLog", StandInAuditLog)
+
+
+@pytest.fixture
+def deleted_items(archive_db, stand_in_models):
+    """Seven trash bin rows; rows share deleted_at in groups of three."""
+    items = [
+        StandInDeletedItem(
+            id=str(uuid4()),
+            workspace_id=WORKSPACE_ID,
+            entity_type="task",
+            entity_id=str(uuid4()),
+            deleted_at=BASE_TIME - timedelta(minutes=index // 3),
+            original_data={"index": index},
+            is_restored=False,
+        )
+        for index in range(7)
+    ]
+    archive_db.add_all(items)
+    archive_db.commit()
+    yield items
+    archive_db.query(StandInDeletedItem).delete()
+    archive_db.commit()
+
+
+@pytest.fixture
+def audit_logs(archive_db, stand_in_models):
+    """Seven audit log rows; rows share logged_at in groups of three."""
+    logs = [
+        StandInAuditLog(
+            id=str(uuid4()),
+            workspace_id=WORKSPACE_ID,
+            action="UPDATE",
+            resource_type="task",
+            resource_id=str(uuid4()),
+            status_code="success",
+            logged_at=BASE_TIME - timedelta(minutes=index // 3),
+        )
+        for index in range(7)
+    ]
+    archive_db.add_all(logs)
+    archive_db.commit()
+    yield logs
+    archive_db.query(StandInAuditLog).delete()
+    archive_db.commit()
+
+
+def _expected_order(rows, sort_attr):
+    return [row.id for row in sorted(rows, key=lambda row: (getattr(row, sort_attr), row.id), reverse=True)]
+
+
+class TestKeysetCursor:
+    """Test suite for the opaque keyset cursor"""
+
+    def test_round_trip(self):
+        """Test that a cursor decodes to the values it was built from"""
+        row_id = str(uuid4())
+        cursor = _encode_keyset_cursor(BASE_TIME, row_id)
+
+        assert _decode_keyset_cursor(cursor) == (BASE_TIME, row_id)
+
+    def test_round_trip_keeps_microseconds(self):
+        """Test that sub-second timestamps survive encoding"""
+        sort_value = BASE_TIME.replace(microsecond=123456)
+
+        assert _decode_keyset_cursor(_encode_keyset_cursor(sort_value, "a"))[0] == sort_value
+
+    @pytest.mark.parametrize("cursor", [
+        "not-a-cursor",
+        "!!!",
+        base64.urlsafe_b64encode(b"no-separator").decode(),
+        base64.urlsafe_b64encode(b"yesterday|some-id").decode(),
+        base64.urlsafe_b64encode(b"\xff\xfe|id").decode(),
+    ])
+    def test_malformed_cursor_raises_value_error(self, cursor):
+        """Test that malformed cursors raise ValueError"""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            _decode_keyset_cursor(cursor)
+
+
+class TestMalformedCursorEndpoints:
+    """Test that a malformed cursor is reported as HTTP 400"""
+
+    def test_trash_bin_returns_400(self):
+        """Test trash bin endpoint with a malformed cursor"""
+        with pytest.raises(HTTPException) as exc_info:
+            archive_endpoints.get_trash_bin(
+                workspace_id=WORKSPACE_ID,
+                entity_type=None,
+                page=1,
+                page_size=20,
+                cursor="not-a-cursor",
+                current_user=Mock(),
+                db=Mock(),
+            )
+
+        assert exc_info.value.status_code == 400
+
+    def test_audit_logs_returns_400(self):
+        """Test audit log endpoint with a malformed cursor"""
+        with pytest.raises(HTTPException) as exc_info:
+            archive_endpoints.get_audit_logs(
+                workspace_id=WORKSPACE_ID,
+                action=None,
+                resource_type=None,
+                user_id=None,
+                page=1,
+                page_size=20,
+                cursor="not-a-cursor",
+                current_user=Mock(),
+                db=Mock(),
+            )
+
+        assert exc_info.value.status_code == 400
+
+
+class TestTrashBinPaging:
+    """Test suite for TrashBinService.get_trash_bin paging"""
+
+    def test_cursor_walk_has_no_duplicates_or_gaps(self, archive_db, deleted_items):
+        """Test walking every page by cursor across shared deleted_at values"""
+        service = TrashBinService(archive_db)
+
+        items, total, cursor = service.get_trash_bin(WORKSPACE_ID, page_size=2)
+        seen = [item.id for item in items]
+        assert total == 7
+        while cursor:
+            items, total, cursor = service.get_trash_bin(WORKSPACE_ID, page_size=2, cursor=cursor)
+            assert total is None
+            seen.extend(item.id for item in items)
+
+        assert seen == _expected_order(deleted_items, "deleted_at")
+
+    def test_last_page_has_no_next_cursor(self, archive_db, deleted_items):
+        """Test that the last offset page returns next_cursor=None"""
+        service = TrashBinService(archive_db)
+
+        items, total, cursor = service.get_trash_bin(WORKSPACE_ID, page=4, page_size=2)
+
+        assert len(items) == 1
+        assert cursor is None
+
+    def test_exact_page_size_has_no_next_cursor(self, archive_db, deleted_items):
+        """Test that a page holding exactly the remaining rows ends the walk"""
+        service = TrashBinService(archive_db)
+
+        items, total, cursor = service.get_trash_bin(WORKSPACE_ID, page_size=7)
+
+        assert len(items) == 7
+        assert cursor is None
+
+
+class TestAuditLogPaging:
+    """Test suite for AuditService.get_audit_logs paging"""
+
+    def test_cursor_walk_has_no_duplicates_or_gaps(self, archive_db, audit_logs):
+        """Test walking every page by cursor across shared logged_at values"""
+        service = AuditService(archive_db)
+
+        logs, total, cursor = service.get_audit_logs(WORKSPACE_ID, AuditLogQueryFilter(page_size=3))
+        seen = [log.id for log in logs]
+        assert total == 7
+        while cursor:
+            logs, total, cursor = service.get_audit_logs(
+                WORKSPACE_ID, AuditLogQueryFilter(page_size=3, cursor=cursor)
+            )
+            assert total is None
+            seen.extend(log.id for log in logs)
+
+        assert seen == _expected_order(audit_logs, "logged_at")
+
+    def test_last_page_has_no_next_cursor(self, archive_db, audit_logs):
+        """Test that the last offset page returns next_cursor=None"""
+        service = AuditService(archive_db)
+
+        logs, total, cursor = service.get_audit_logs(
+            WORKSPACE_ID, AuditLogQueryFilter(page=3, page_size=3)
+        )
+
+        assert len(logs) == 1
+        assert cursor is None
@@ -0,0 +1,137 @@
+"""
+Unit Tests for NoteService.get_note_subtree
+Tests the recursive subtree query and the tree built from its rows.
+"""
+import pytest
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, MetaData, Table, create_engine
+from sqlalchemy.orm import registry, sessionmaker
+
+from app.db.enums import NoteAccessEnum
+from app.models.collaboration import Note
+from app.schemas.collaboration import NoteTreeResponse
+from app.services import collaboration as collaboration_service
+from app.services.collaboration import NoteService
+
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class StandInNote:
+    """Mapped copy of ``notes`` used in place of Note."""
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+@pytest.fixture
+def notes_db(monkeypatch):
+    """
+    In-memory session over a stand-in notes table.
+
+    The shared ``db`` fixture cannot build the full schema, so the subtree
+    query runs against a copy of the real notes table columns.
+    """
+    metadata = MetaData()
+    mapper_registry = registry(metadata=metadata)
+    # Same columns, types and defaults, minus foreign keys and indexes
+    table = Table(
+        Note.__table__.name,
+        metadata,
+        *[
+            Column(
+                column.name,
+                column.type,
+                primary_key=column.primary_key,
+                nullable=column.nullable,
+                default=column.default,
+                server_default=column.server_default,
+            )
+            for column in Note.__table__.columns
+        ],
+    )
+    mapper_registry.map_imperatively(StandInNote, table)
+    monkeypatch.setattr(collaboration_service, "Note", StandInNote)
+
+    engine = create_engine("sqlite:///:memory:")
+    metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    mapper_registry.dispose()
+    engine.dispose()
+
+
+def _add_note(db, title, parent=None, order_index=0, minutes=0):
+    note = StandInNote(
+        id=uuid.uuid4(),
+        project_id=None,
+        parent_note_id=parent.id if parent is not None else None,
+        user_id=uuid.uuid4(),
+        title=title,
+        content=title,
+        access_level=NoteAccessEnum.PRIVATE,
+        is_template=False,
+        is_pinned=False,
+        order_index=order_index,
+        view_count=0,
+        comment_count=0,
+        created_at=BASE_TIME + timedelta(minutes=minutes),
+        updated_at=BASE_TIME + timedelta(minutes=minutes),
+    )
+    db.add(note)
+    db.commit()
+    return note
+
+
+class TestGetNoteSubtree:
+    """Test suite for NoteService.get_note_subtree"""
+
+    def test_subtree_below_top_level(self, notes_db):
+        """Test that only the requested note and its descendants are returned"""
+        top = _add_note(notes_db, "top")
+        sibling = _add_note(notes_db, "sibling", parent=top, order_index=1)
+        section = _add_note(notes_db, "section", parent=top, order_index=2)
+        page = _add_note(notes_db, "page", parent=section, order_index=0)
+        subpage = _add_note(notes_db, "subpage", parent=page, order_index=0)
+        _add_note(notes_db, "sibling child", parent=sibling)
+
+        notes = NoteService.get_note_subtree(db=notes_db, note_id=section.id)
+
+        assert {note.id for note in notes} == {section.id, page.id, subpage.id}
+
+    def test_rows_are_ordered_by_order_index_then_created_at(self, notes_db):
+        """Test the ordering of rows returned by the subtree query"""
+        root = _add_note(notes_db, "root", order_index=5)
+        _add_note(notes_db, "later", parent=root, order_index=1, minutes=2)
+        _add_note(notes_db, "earlier", parent=root, order_index=1, minutes=1)
+        _add_note(notes_db, "first", parent=root, order_index=0, minutes=3)
+
+        notes = NoteService.get_note_subtree(db=notes_db, note_id=root.id)
+
+        assert [note.title for note in notes] == ["first", "earlier", "later", "root"]
+
+    def test_forest_has_requested_note_as_only_root(self, notes_db):
+        """Test that the subtree rows build a single tree rooted at the requested note"""
+        top = _add_note(notes_db, "top")
+        section = _add_note(notes_db, "section", parent=top, order_index=3)
+        second = _add_note(notes_db, "second", parent=section, order_index=1)
+        first = _add_note(notes_db, "first", parent=section, order_index=0)
+        nested = _add_note(notes_db, "nested", parent=second, order_index=0)
+
+        forest = NoteTreeResponse.build_forest(
+            NoteService.get_note_subtree(db=notes_db, note_id=section.id)
+        )
+
+        assert [node.id for node in forest] == [section.id]
+        assert [child.id for child in forest[0].children] == [first.id, second.id]
+        assert [child.id for child in forest[0].children[1].children] == [nested.id]
+
+    def test_unknown_note_returns_empty_list(self, notes_db):
+        """Test that an unknown note id yields no rows"""
+        _add_note(notes_db, "top")
+
+        assert NoteService.get_note_subtree(db=notes_db, note_id=uuid.uuid4()) == []
@@ -0,0 +1,98 @@
+"""
+Unit Tests for session revocation by request id
+Tests that the RevokeSessionRequest id reaches SessionService as a UUID.
+"""
+import asyncio
+import pytest
+import uuid
+from types import SimpleNamespace
+
+from sqlalchemy import Column, MetaData, Table, create_engine
+from sqlalchemy.orm import registry, sessionmaker
+
+from app.api.v1.endpoints import auth as auth_endpoints
+from app.models.users import Session as SessionModel
+from app.schemas.auth import RevokeSessionRequest
+from app.services import session as session_service_module
+
+
+class StandInSession:
+    """Mapped copy of ``sessions`` used in place of the Session model."""
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+@pytest.fixture
+def sessions_db(monkeypatch):
+    """
+    In-memory session over a stand-in sessions table.
+
+    SQLite has no native UUID type, so string ids fail to bind here, which
+    is what these tests rely on to catch an unconverted id.
+    """
+    metadata = MetaData()
+    mapper_registry = registry(metadata=metadata)
+    # Same columns, types and defaults, minus foreign keys and indexes
+    table = Table(
+        SessionModel.__table__.name,
+        metadata,
+        *[
+            Column(
+                column.name,
+                column.type,
+                primary_key=column.primary_key,
+                nullable=column.nullable,
+                default=column.default,
+                server_default=column.server_default,
+            )
+            for column in SessionModel.__table__.columns
+        ],
+    )
+    mapper_registry.map_imperatively(StandInSession, table)
+    monkeypatch.setattr(session_service_module, "SessionModel", StandInSession)
+
+    engine = create_engine("sqlite:///:memory:")
+    metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+    mapper_registry.dispose()
+    engine.dispose()
+
+
+class TestRevokeSessionEndpoint:
+    """Test suite for the revoke-session endpoint and SessionService.revoke_session"""
+
+    def test_revokes_session_by_request_id(self, sessions_db):
+        """Test that a canonical id string from the request revokes the session"""
+        user_id = uuid.uuid4()
+        stored = StandInSession(id=uuid.uuid4(), user_id=user_id, token="token")
+        sessions_db.add(stored)
+        sessions_db.commit()
+
+        result = asyncio.run(auth_endpoints.revoke_session(
+            request=RevokeSessionRequest(session_id=str(stored.id)),
+            current_user=SimpleNamespace(id=user_id),
+            db=sessions_db,
+        ))
+
+        assert result == {"message": "Session revoked successfully"}
+        assert sessions_db.get(StandInSession, stored.id).revoked_at is not None
+
+    def test_other_users_session_is_not_found(self, sessions_db):
+        """Test that a session owned by another user is reported as not found"""
+        stored = StandInSession(id=uuid.uuid4(), user_id=uuid.uuid4(), token="token")
+        sessions_db.add(stored)
+        sessions_db.commit()
+
+        with pytest.raises(auth_endpoints.HTTPException) as exc_info:
+            asyncio.run(auth_endpoints.revoke_session(
+                request=RevokeSessionRequest(session_id=str(stored.id)),
+                current_user=SimpleNamespace(id=uuid.uuid4()),
+                db=sessions_db,
+            ))
+
+        assert exc_info.value.status_code == 404
+        assert sessions_db.get(StandInSession, stored.id).revoked_at is None